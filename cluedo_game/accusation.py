@@ -1,5 +1,5 @@
 from cluedo_game.player import Player
-from cluedo_game.solution import Solution
+from cluedo_game.solution import Solution, solution_key
 
 
 def make_accusation(game, player, suspect, weapon, room):
@@ -7,12 +7,8 @@ def make_accusation(game, player, suspect, weapon, room):
     Handle a player's accusation. If correct, returns True (win). If incorrect, marks player eliminated and returns False.
     Prints outcome via game's output_func.
     """
-    # Compare by name for suspect/weapon, by object identity for room
-    is_correct = (
-        game.solution.character.name == suspect.name and
-        game.solution.weapon.name == weapon.name and
-        game.solution.room == room
-    )
+    # Compare names; the room may be a Room, a RoomCard or a room name
+    is_correct = (suspect.name, weapon.name, getattr(room, 'name', room)) == solution_key(game.solution)
     if is_correct:
         game.output("\nCongratulations! You Win!")
         game.output(f"The solution was: {game.solution.character.name} with the {game.solution.weapon.name} in the {game.solution.room.name}.")
@@ -11,7 +11,7 @@ This package contains the modular components that power the Nash AI player's dec
 
 # Import key components to make them easily accessible
 from .bayesian_model import BayesianModel
-from .suggestion_engine import SuggestionEngine
+from .suggestion_engine import SuggestionEngine, SuggestionRecord
 from .movement_strategy import MovementStrategy
 from .learning import LearningModule
 from .nash_ai_player import NashAIPlayer
@@ -20,6 +20,7 @@ from .utils import *
 __all__ = [
     'BayesianModel', 
     'SuggestionEngine', 
+    'SuggestionRecord',
     'MovementStrategy', 
     'LearningModule',
     'NashAIPlayer'
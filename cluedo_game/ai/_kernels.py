@@ -0,0 +1,114 @@
+"""
+Numeric kernels for the Nash AI player.
+
+Destination scoring and belief updates run in tight loops during simulated
+games, so the arithmetic is kept here on plain NumPy arrays. When numba is
+installed the kernels are compiled; otherwise equivalent vectorized NumPy
+versions are used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def _score_destinations_loop(probs, visited, is_corridor, center,
+                             adj_probs, adj_offsets):
+    """
+    Score movement destinations one at a time (the kernel compiled by numba).
+    
+    Args:
+        probs: Solution probability of each destination (0.0 for corridors)
+        visited: Whether each destination was visited recently
+        is_corridor: Whether each destination is a corridor
+        center: Whether each destination is a centre corridor
+        adj_probs: Probabilities of the unvisited rooms adjacent to each
+            destination, concatenated in destination order
+        adj_offsets: Start of each destination's slice of ``adj_probs``, with
+            a final entry equal to ``len(adj_probs)``
+            
+    Returns:
+        np.ndarray: Score of each destination (higher is better)
+    """
+    n = probs.shape[0]
+    scores = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        if is_corridor[i]:
+            # Base score with a slight preference for the board centre
+            score = 30.0
+            if center[i]:
+                score += 5.0
+            weight = 15.0
+        else:
+            # Base score, recent-visit penalty and uncertainty bonus
+            # (maximum uncertainty at p=0.5)
+            score = 50.0 + 30.0 * (1.0 - abs(probs[i] - 0.5) * 2.0)
+            if visited[i]:
+                score -= 20.0
+            weight = 10.0
+        # Bonus for unvisited, uncertain rooms next to the destination
+        for j in range(adj_offsets[i], adj_offsets[i + 1]):
+            score += (1.0 - adj_probs[j]) * weight
+        scores[i] = score
+    return scores
+
+
+def _score_destinations_numpy(probs, visited, is_corridor, center,
+                              adj_probs, adj_offsets):
+    """Score movement destinations with whole-array NumPy operations."""
+    n = probs.shape[0]
+    uncertainty = 1.0 - np.abs(probs - 0.5) * 2.0
+    room_scores = 50.0 - 20.0 * visited + 30.0 * uncertainty
+    corridor_scores = 30.0 + 5.0 * center
+    scores = np.where(is_corridor, corridor_scores, room_scores)
+
+    if adj_probs.size:
+        owners = np.repeat(np.arange(n), np.diff(adj_offsets))
+        gain = np.bincount(owners, weights=1.0 - adj_probs, minlength=n)
+        scores += gain * np.where(is_corridor, 15.0, 10.0)
+    return scores
+
+
+def _update_posterior_loop(prior, seen, not_holding, alpha, out):
+    """
+    Recompute the unnormalized posterior of one card type (the kernel
+    compiled by numba).
+    
+    Args:
+        prior: Prior probability of each card being in the solution
+        seen: Whether each card has been seen (and so is not in the solution)
+        not_holding: Number of players known not to hold each card
+        alpha: Likelihood boost per player known not to hold a card
+        out: Array the posterior weights are written to
+        
+    Returns:
+        float: Sum of the posterior weights
+    """
+    total = 0.0
+    for i in range(prior.shape[0]):
+        if seen[i]:
+            weight = 0.0
+        else:
+            weight = prior[i] * (1.0 + not_holding[i] * alpha)
+        out[i] = weight
+        total += weight
+    return total
+
+
+def _update_posterior_numpy(prior, seen, not_holding, alpha, out):
+    """Recompute the unnormalized posterior of one card type with NumPy."""
+    likelihood = np.where(seen, 0.0, 1.0 + not_holding * alpha)
+    np.multiply(prior, likelihood, out=out)
+    return float(out.sum())
+
+
+if njit is not None:
+    score_destinations = njit(cache=True)(_score_destinations_loop)
+    update_posterior = njit(cache=True)(_update_posterior_loop)
+else:
+    score_destinations = _score_destinations_numpy
+    update_posterior = _update_posterior_numpy
+
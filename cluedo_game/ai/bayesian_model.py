@@ -7,15 +7,143 @@ for the Nash equilibrium-based Cluedo AI player.
 
 import math
 import random
-from typing import Dict, List, Set, Tuple, Optional, Any, DefaultDict
+import sys
+from typing import Dict, List, Set, Tuple, Optional, Any, DefaultDict, Iterator, Sequence, Mapping, Callable
 from collections import defaultdict
+from collections.abc import MutableMapping, Mapping as _AbcMapping
 from dataclasses import dataclass, field
 
-from cluedo_game.cards import SuspectCard, WeaponCard, RoomCard, Card
+import numpy as np
+
+from cluedo_game.cards import SuspectCard, WeaponCard, RoomCard, Card, get_suspects, get_weapons, get_rooms
 from cluedo_game.character import Character
+from .utils import MAX_PLAYERS, _ROOM_NAMES_LC, _WEAPON_NAMES_LC
+from ._kernels import update_posterior
+
+# Card class -> card type, used to classify cards without an isinstance chain
+_TYPE_TABLE = {
+    SuspectCard: 'suspects',
+    WeaponCard: 'weapons',
+    RoomCard: 'rooms',
+}
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _card_name(card) -> str:
+    """Return a card's interned name, or its string form for plain names and rooms."""
+    name = getattr(card, 'name', None)
+    if name is None:
+        name = str(card)
+    # Interned names share one object with the model's keys, so set and
+    # dict lookups hit the identity fast path
+    return sys.intern(name) if type(name) is str else name
+
+
+class _ProbabilityView(MutableMapping):
+    """
+    Dict-like view over the probability array of a single card type.
+    
+    Reads and writes go straight through to the underlying NumPy array, so
+    callers that still treat ``priors``/``posteriors`` as plain dictionaries
+    always see the current state of the model. When ``sums`` is given the
+    array holds unnormalized weights and reads divide by ``sums[card_type]``.
+    ``on_write`` is called after every write.
+    """
+    
+    __slots__ = ('_names', '_idx', '_arr', '_sums', '_card_type', '_on_write')
+    
+    def __init__(self, names: List[str], idx: Dict[str, int], arr: np.ndarray,
+                 sums: Optional[Dict[str, float]] = None, card_type: str = '',
+                 on_write: Optional[Callable[[], None]] = None):
+        self._names = names
+        self._idx = idx
+        self._arr = arr
+        self._sums = sums
+        self._card_type = card_type
+        self._on_write = on_write
+    
+    def _total(self) -> float:
+        return 1.0 if self._sums is None else self._sums[self._card_type]
+    
+    def __getitem__(self, card_name: str) -> float:
+        total = self._total()
+        return float(self._arr[self._idx[card_name]] / total) if total > 0 else 0.0
+    
+    def __setitem__(self, card_name: str, value: float):
+        self._arr[self._idx[card_name]] = value
+        if self._sums is not None:
+            self._sums[self._card_type] = float(self._arr.sum())
+        if self._on_write is not None:
+            self._on_write()
+    
+    def update(self, other=(), **kwargs):
+        """Write several probabilities with one array assignment."""
+        values = dict(other, **kwargs)
+        if not values:
+            return
+        self._arr[[self._idx[name] for name in values]] = list(values.values())
+        if self._sums is not None:
+            self._sums[self._card_type] = float(self._arr.sum())
+        if self._on_write is not None:
+            self._on_write()
+    
+    def __delitem__(self, card_name: str):
+        raise TypeError("Cards cannot be removed from the probability model")
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def copy(self) -> Dict[str, float]:
+        """Return a plain dictionary snapshot of the current probabilities."""
+        total = self._total()
+        values = (self._arr / total).tolist() if total > 0 else [0.0] * len(self._names)
+        return dict(zip(self._names, values))
+    
+    def __repr__(self):
+        return repr(self.copy())
+
 
+class _PlayerCardsView(_AbcMapping):
+    """
+    Read-only mapping of player name -> card names over one of the model's
+    player/card matrices (``holds`` or ``not_holds``).
+    """
+    
+    __slots__ = ('_model', '_attr')
+    
+    def __init__(self, model: 'BayesianModel', attr: str):
+        self._model = model
+        self._attr = attr
+    
+    def __getitem__(self, player_name: str) -> Set[str]:
+        # Unknown players hold nothing, as with the defaultdict this replaces
+        row = self._model._player_idx.get(player_name)
+        if row is None:
+            return set()
+        col_names = self._model._col_names
+        matrix = getattr(self._model, self._attr)
+        return {col_names[col] for col in np.flatnonzero(matrix[row])}
+    
+    def __contains__(self, player_name: object) -> bool:
+        return player_name in self._model._player_idx
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._model._player_idx)
+    
+    def __len__(self) -> int:
+        return len(self._model._player_idx)
+    
+    def __repr__(self):
+        return repr({player: self[player] for player in self})
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class BayesianModel:
     """
     Manages the Bayesian probability model for the Nash AI player.
@@ -26,19 +154,11 @@ class BayesianModel:
     - Calculating probabilities for decision making
     """
     
-    # Prior probability distributions
-    priors: Dict[str, Dict[str, float]] = field(default_factory=lambda: {
-        'suspects': {},
-        'weapons': {},
-        'rooms': {}
-    })
+    # Prior probability distributions (dict views over ``_priors_arr``)
+    priors: Dict[str, Dict[str, float]] = field(default_factory=dict)
     
-    # Posterior probability distributions
-    posteriors: Dict[str, Dict[str, float]] = field(default_factory=lambda: {
-        'suspects': {},
-        'weapons': {},
-        'rooms': {}
-    })
+    # Posterior probability distributions (dict views over ``_post_arr``)
+    posteriors: Dict[str, Dict[str, float]] = field(default_factory=dict)
     
     # Track which cards have been seen
     seen_cards: Set[str] = field(default_factory=set)
@@ -48,41 +168,123 @@ class BayesianModel:
         default_factory=lambda: defaultdict(dict)
     )
     
-    # Track known card assignments
-    player_cards: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
-    player_not_cards: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
+    # Known card assignments as (player x card) 0/1 matrices, with columns
+    # in suspects, weapons, rooms order. Rows are assigned to players on
+    # first reference and the matrices grow if more players turn up.
+    holds: np.ndarray = field(default=None, init=False, repr=False)
+    not_holds: np.ndarray = field(default=None, init=False, repr=False)
+    
+    # Read-only player -> card names views over holds/not_holds
+    player_cards: Mapping[str, Set[str]] = field(default=None, init=False, repr=False)
+    player_not_cards: Mapping[str, Set[str]] = field(default=None, init=False, repr=False)
+    
+    # Likelihood weight added per player known not to hold an unseen card
+    refutation_alpha: float = 0.5
+    
+    # Bumped on every change to the evidence or posteriors, so callers can
+    # cache values derived from the belief state
+    version: int = field(default=0, init=False)
+    
+    # Array-backed state: card names and name -> index map per card type,
+    # plus prior vectors, unnormalized posterior weights with their running
+    # sums, a mask of cards known not to be in the solution, each type's
+    # first column in the player/card matrices, and player name -> row.
+    _names: Dict[str, List[str]] = field(default_factory=dict, init=False, repr=False)
+    _idx: Dict[str, Dict[str, int]] = field(default_factory=dict, init=False, repr=False)
+    _priors_arr: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False)
+    _post_arr: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False)
+    _post_sum: Dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _seen: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False)
+    _col_offset: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _col_names: List[str] = field(default_factory=list, init=False, repr=False)
+    _player_idx: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    
+    # Nesting depth of begin_batch()/end_batch(); updates are deferred while > 0
+    _batch_depth: int = field(default=0, init=False, repr=False)
+    
+    # Most likely solution and the version it was computed for
+    _ml_solution: Dict[str, str] = field(default=None, init=False, repr=False)
+    _ml_solution_version: int = field(default=-1, init=False, repr=False)
     
     def __post_init__(self):
         """Initialize the model with uniform priors."""
         self._init_priors()
         self._init_posteriors()
+        self._init_player_cards()
     
     def _init_priors(self):
         """Initialize uniform prior probabilities for all cards."""
-        from cluedo_game.cards import get_suspects, get_weapons, get_rooms
-        
-        # Initialize suspect priors
-        suspects = get_suspects()
-        suspect_count = len(suspects)
-        for suspect in suspects:
-            self.priors['suspects'][suspect.name] = 1.0 / suspect_count
-        
-        # Initialize weapon priors
-        weapons = get_weapons()
-        weapon_count = len(weapons)
-        for weapon in weapons:
-            self.priors['weapons'][weapon.name] = 1.0 / weapon_count
-        
-        # Initialize room priors
-        rooms = get_rooms()
-        room_count = len(rooms)
-        for room in rooms:
-            self.priors['rooms'][room] = 1.0 / room_count
+        card_names = {
+            'suspects': [sys.intern(suspect.name) for suspect in get_suspects()],
+            'weapons': [sys.intern(weapon.name) for weapon in get_weapons()],
+            'rooms': [sys.intern(room) for room in get_rooms()],
+        }
+        
+        for card_type, names in card_names.items():
+            count = len(names)
+            self._names[card_type] = names
+            self._idx[card_type] = {name: i for i, name in enumerate(names)}
+            self._priors_arr[card_type] = np.full(count, 1.0 / count, dtype=np.float64)
+            self._seen[card_type] = np.zeros(count, dtype=bool)
+            self._col_offset[card_type] = len(self._col_names)
+            self._col_names.extend(names)
+            self.priors[card_type] = _ProbabilityView(
+                names, self._idx[card_type], self._priors_arr[card_type]
+            )
     
     def _init_posteriors(self):
         """Initialize posteriors to match priors."""
-        for card_type in self.priors:
-            self.posteriors[card_type] = self.priors[card_type].copy()
+        for card_type, prior in self._priors_arr.items():
+            self._post_arr[card_type] = prior.copy()
+            self._post_sum[card_type] = float(prior.sum())
+            self.posteriors[card_type] = _ProbabilityView(
+                self._names[card_type], self._idx[card_type], self._post_arr[card_type],
+                self._post_sum, card_type, self._bump_version
+            )
+    
+    def _init_player_cards(self):
+        """Allocate the player/card matrices and their mapping views."""
+        shape = (MAX_PLAYERS, len(self._col_names))
+        self.holds = np.zeros(shape, dtype=np.uint8)
+        self.not_holds = np.zeros(shape, dtype=np.uint8)
+        self.player_cards = _PlayerCardsView(self, 'holds')
+        self.player_not_cards = _PlayerCardsView(self, 'not_holds')
+    
+    def _player_row(self, player_name: str) -> int:
+        """Return the matrix row for a player, assigning one on first use."""
+        row = self._player_idx.get(player_name)
+        if row is None:
+            row = self._player_idx[player_name] = len(self._player_idx)
+            if row >= self.holds.shape[0]:
+                # More players than rows (e.g. the 'solution' pseudo-player)
+                self.holds = np.vstack([self.holds, np.zeros_like(self.holds)])
+                self.not_holds = np.vstack([self.not_holds, np.zeros_like(self.not_holds)])
+        return row
+    
+    def _card_col(self, card_type: str, card_name: str) -> Optional[int]:
+        """Return the matrix column for a card, or None for unknown cards."""
+        i = self._idx[card_type].get(card_name)
+        return None if i is None else self._col_offset[card_type] + i
+    
+    def _bump_version(self):
+        """Mark the belief state as changed."""
+        self.version += 1
+    
+    def begin_batch(self):
+        """
+        Start a batch of evidence updates.
+        
+        Until the matching end_batch() call, update_from_card_reveal and
+        update_from_no_refutation only record evidence and skip recomputing
+        the posteriors.
+        """
+        self._batch_depth += 1
+    
+    def end_batch(self):
+        """End a batch of evidence updates and recompute the posteriors once."""
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if not self._batch_depth:
+            self._update_probabilities()
     
     def update_from_card_reveal(self, card: Card, player_name: str):
         """
@@ -92,19 +294,24 @@ class BayesianModel:
             card: The card that was revealed
             player_name: Name of the player who showed the card
         """
-        card_name = card.name if hasattr(card, 'name') else str(card)
+        card_name = _card_name(card)
         card_type = self._get_card_type(card)
         
         # Add to seen cards
         self.seen_cards.add(card_name)
+        self.version += 1
+        i = self._idx[card_type].get(card_name)
+        if i is not None:
+            self._seen[card_type][i] = True
         
         # Update player-card assignments
-        if player_name not in self.player_cards:
-            self.player_cards[player_name] = set()
-        self.player_cards[player_name].add(card_name)
+        row = self._player_row(player_name)
+        if i is not None:
+            self.holds[row, self._col_offset[card_type] + i] = 1
         
         # Update probabilities
-        self._update_probabilities()
+        if i is not None and not self._batch_depth:
+            self._drop_card(card_type, i)
     
     def update_from_no_refutation(self, suggestion: Dict[str, Any], game):
         """
@@ -123,18 +330,25 @@ class BayesianModel:
         # Update probabilities for each card in the suggestion
         for card_type in ['character', 'weapon', 'room']:
             card = suggestion[card_type]
-            card_name = card.name if hasattr(card, 'name') else str(card)
+            card_name = _card_name(card)
             
             # If we haven't seen this card yet
             if card_name not in self.seen_cards:
                 # For players who couldn't refute, they don't have these cards
                 for player_name in players_without_cards:
-                    if player_name not in self.player_not_cards:
-                        self.player_not_cards[player_name] = set()
-                    self.player_not_cards[player_name].add(card_name)
+                    self._mark_not_holding(player_name, card)
+        self.version += 1
         
         # Recalculate probabilities
-        self._update_probabilities()
+        if not self._batch_depth:
+            self._update_probabilities()
+    
+    def _mark_not_holding(self, player_name: str, card: Any):
+        """Record that a player does not hold a card."""
+        row = self._player_row(player_name)
+        col = self._card_col(self._get_card_type(card), _card_name(card))
+        if col is not None:
+            self.not_holds[row, col] = 1
     
     def get_card_probability(self, card_type: str, card_name: str) -> float:
         """
@@ -147,7 +361,66 @@ class BayesianModel:
         Returns:
             float: Probability between 0 and 1
         """
-        return self.posteriors[card_type].get(card_name, 0.0)
+        i = self._idx[card_type].get(card_name)
+        total = self._post_sum[card_type]
+        if i is None or total <= 0:
+            return 0.0
+        return float(self._post_arr[card_type][i] / total)
+    
+    def get_card_probs(self, card_type: str, names: Sequence[str]) -> np.ndarray:
+        """
+        Get the current solution probabilities for several cards at once.
+        
+        Args:
+            card_type: Type of card ('suspects', 'weapons', 'rooms')
+            names: Card names to look up
+            
+        Returns:
+            np.ndarray: Probabilities in the same order as ``names`` (0.0 for
+            names that are not cards of this type)
+        """
+        idx = self._idx[card_type]
+        total = self._post_sum[card_type]
+        # Unknown names index the trailing 0.0 sentinel
+        lookup = [idx.get(name, -1) for name in names]
+        probs = np.append(self._post_arr[card_type], 0.0)[lookup]
+        if total > 0:
+            probs /= total
+        else:
+            probs[:] = 0.0
+        return probs
+    
+    def get_seen_flags(self, card_type: str, names: Sequence[str]) -> np.ndarray:
+        """
+        Get whether each of several cards has been seen.
+        
+        Reads the per-type seen mask kept by update_from_card_reveal, so no
+        string lookups in seen_cards are needed.
+        
+        Args:
+            card_type: Type of card ('suspects', 'weapons', 'rooms')
+            names: Card names to look up
+            
+        Returns:
+            np.ndarray: Boolean flags in the same order as ``names`` (False for
+            names that are not cards of this type)
+        """
+        idx = self._idx[card_type]
+        lookup = [idx.get(name, -1) for name in names]
+        return np.append(self._seen[card_type], False)[lookup]
+    
+    def get_room_probs(self, names: Sequence[str]) -> np.ndarray:
+        """
+        Get the current solution probabilities for several rooms at once.
+        
+        Args:
+            names: Room names to look up
+            
+        Returns:
+            np.ndarray: Probabilities in the same order as ``names`` (0.0 for
+            names that are not rooms)
+        """
+        return self.get_card_probs('rooms', names)
     
     def get_most_likely_solution(self) -> Dict[str, str]:
         """
@@ -156,74 +429,69 @@ class BayesianModel:
         Returns:
             Dict with 'character', 'weapon', 'room' keys and the most likely values
         """
+        if self._ml_solution_version == self.version:
+            return dict(self._ml_solution)
+        
         solution = {}
         
-        # Find most likely suspect
-        if self.posteriors['suspects']:
-            solution['character'] = max(
-                self.posteriors['suspects'].items(), 
-                key=lambda x: x[1]
-            )[0]
-        
-        # Find most likely weapon
-        if self.posteriors['weapons']:
-            solution['weapon'] = max(
-                self.posteriors['weapons'].items(),
-                key=lambda x: x[1]
-            )[0]
-        
-        # Find most likely room
-        if self.posteriors['rooms']:
-            solution['room'] = max(
-                self.posteriors['rooms'].items(),
-                key=lambda x: x[1]
-            )[0]
-        
-        return solution
+        for key, card_type in (('character', 'suspects'),
+                               ('weapon', 'weapons'),
+                               ('room', 'rooms')):
+            names = self._names[card_type]
+            if names:
+                solution[key] = names[int(np.argmax(self._post_arr[card_type]))]
+        
+        self._ml_solution = solution
+        self._ml_solution_version = self.version
+        return dict(solution)
     
     def _update_probabilities(self):
         """Update all probability distributions based on current evidence."""
-        # Update posteriors based on priors and evidence
-        # This is a simplified version - in practice, you'd use Bayesian updating
-        # with the actual evidence from the game
-        
-        # For now, just copy priors to posteriors
-        # In a real implementation, this would update based on evidence
-        for card_type in self.priors:
-            for card_name in self.priors[card_type]:
-                # If we've seen the card, it's not in the solution
-                if card_name in self.seen_cards:
-                    self.posteriors[card_type][card_name] = 0.0
-                else:
-                    # Otherwise, use the prior (will be normalized)
-                    self.posteriors[card_type][card_name] = self.priors[card_type][card_name]
-        
-        # Normalize probabilities for each card type
-        for card_type in self.posteriors:
-            self._normalize_probabilities(card_type)
-    
-    def _normalize_probabilities(self, card_type: str):
-        """Normalize probabilities for a card type to sum to 1."""
-        total = sum(self.posteriors[card_type].values())
-        if total > 0:
-            for card_name in self.posteriors[card_type]:
-                self.posteriors[card_type][card_name] /= total
+        # P(solution | evidence) is proportional to P(evidence | solution) *
+        # P(solution). Seen cards are not in the solution; an unseen card that
+        # players failed to refute is more likely to be, by refutation_alpha
+        # per such player. Written in place so the dict views stay valid, and
+        # left unnormalized: readers divide by the stored sum.
+        self.version += 1
+        not_holding = self.not_holds.sum(axis=0)
+        for card_type, prior in self._priors_arr.items():
+            start = self._col_offset[card_type]
+            self._post_sum[card_type] = float(update_posterior(
+                prior, self._seen[card_type], not_holding[start:start + prior.size],
+                self.refutation_alpha, self._post_arr[card_type]
+            ))
+    
+    def _drop_card(self, card_type: str, i: int):
+        """Remove a newly seen card's weight from the posteriors of its type."""
+        if self._post_sum[card_type] <= 0:
+            # Nothing to adjust incrementally (e.g. weights cleared through
+            # the posteriors view), so rebuild from the priors
+            self._update_probabilities()
+            return
+        post = self._post_arr[card_type]
+        self._post_sum[card_type] -= float(post[i])
+        post[i] = 0.0
     
     @staticmethod
     def _get_card_type(card) -> str:
         """Determine the type of a card."""
-        if isinstance(card, SuspectCard) or (hasattr(card, 'is_suspect') and card.is_suspect):
+        card_type = _TYPE_TABLE.get(type(card))
+        if card_type:
+            return card_type
+        
+        # Subclasses of the card classes and duck-typed cards
+        if isinstance(card, SuspectCard) or getattr(card, 'is_suspect', False):
             return 'suspects'
-        elif isinstance(card, WeaponCard) or (hasattr(card, 'is_weapon') and card.is_weapon):
+        elif isinstance(card, WeaponCard) or getattr(card, 'is_weapon', False):
             return 'weapons'
-        elif isinstance(card, RoomCard) or (hasattr(card, 'is_room') and card.is_room):
+        elif isinstance(card, RoomCard) or getattr(card, 'is_room', False):
             return 'rooms'
+        
+        # Fall back to the card's name (Room objects, plain strings)
+        card_str = str(getattr(card, 'name', card)).lower()
+        if card_str in _ROOM_NAMES_LC:
+            return 'rooms'
+        elif card_str in _WEAPON_NAMES_LC:
+            return 'weapons'
         else:
-            # Try to infer from string representation
-            card_str = str(card).lower()
-            if any(room.lower() in card_str for room in get_rooms()):
-                return 'rooms'
-            elif any(weapon.lower() in card_str for weapon in [w.name.lower() for w in get_weapons()]):
-                return 'weapons'
-            else:
-                return 'suspects'  # Default to suspect if unknown
+            return 'suspects'  # Default to suspect if unknown
@@ -5,11 +5,13 @@ This module handles learning from game events and updating the AI's knowledge
 based on observations of other players' actions.
 """
 
+import logging
 from typing import Dict, List, Optional, Any, Set
-from collections import defaultdict
 
 from cluedo_game.cards import Card, SuspectCard, WeaponCard, RoomCard
-from .bayesian_model import BayesianModel
+from .bayesian_model import BayesianModel, _card_name
+
+logger = logging.getLogger(__name__)
 
 
 class LearningModule:
@@ -30,7 +32,47 @@ class LearningModule:
             model: The BayesianModel instance to update
         """
         self.model = model
-        self.known_refutations = defaultdict(set)  # player -> set of card names they've shown
+        # Bound accessor for the entries of _history_source, the suggestion
+        # history last seen; resolved once rather than probed every turn
+        self._history_accessor = None
+        self._history_source = None
+        # Fingerprint of the evidence last folded into the model by
+        # update_belief_state; an unchanged fingerprint means nothing new
+        self._belief_key = None
+    
+    def reset_game_state(self):
+        """Forget the suggestion history accessor; call when a new game starts."""
+        self._history_accessor = None
+        self._history_source = None
+        self._belief_key = None
+    
+    def _evidence_key(self, game_state: Any, players: List[Any], entries: List[Any]) -> tuple:
+        """
+        Fingerprint the evidence update_belief_state reads from a game.
+        
+        Hands are dealt once and the suggestion history only grows, so the
+        identity and size of each hand plus the number of history entries
+        tell whether there is anything new to learn.
+        """
+        hands = tuple((id(hand), len(hand)) for hand in
+                      (getattr(player, 'hand', None) or () for player in players))
+        return id(game_state), hands, len(entries)
+    
+    def _history_entries(self, history: Any):
+        """Return the entries of a suggestion history, resolving its accessor once."""
+        if self._history_accessor is None or history is not self._history_source:
+            # Use get_all() if available, otherwise access records directly
+            if hasattr(history, 'get_all'):
+                self._history_accessor = history.get_all
+            else:
+                self._history_accessor = lambda history=history: getattr(history, 'records', [])
+            self._history_source = history
+        return self._history_accessor()
+    
+    @property
+    def known_refutations(self):
+        """Player -> set of card names they are known to hold (from the model's holds matrix)."""
+        return self.model.player_cards
     
     def process_refutation(self, player_name: str, suggestion: Dict[str, Any], 
                          shown_card: Optional[Card] = None):
@@ -44,9 +86,6 @@ class LearningModule:
         """
         if shown_card:
             # Record that this player has this card
-            self.known_refutations[player_name].add(shown_card.name)
-            
-            # Update the model with this information
             self.model.update_from_card_reveal(shown_card, player_name)
     
     def process_no_refutation(self, suggestion: Dict[str, Any], game_state: Any):
@@ -94,20 +133,19 @@ class LearningModule:
         """
         if is_correct:
             # Game over - update our model with the solution
-            self.model.update_from_card_reveal(accusation['character'], 'solution')
-            self.model.update_from_card_reveal(accusation['weapon'], 'solution')
-            self.model.update_from_card_reveal(accusation['room'], 'solution')
+            self.model.begin_batch()
+            try:
+                self.model.update_from_card_reveal(accusation['character'], 'solution')
+                self.model.update_from_card_reveal(accusation['weapon'], 'solution')
+                self.model.update_from_card_reveal(accusation['room'], 'solution')
+            finally:
+                self.model.end_batch()
         else:
             # The player made an incorrect accusation - they must not have all these cards
             # This is a strong signal that these cards are not in their hand
             for card_type in ['character', 'weapon', 'room']:
-                card = accusation[card_type]
-                card_name = card.name if hasattr(card, 'name') else str(card)
-                
                 # Add to player's known not-cards
-                if player_name not in self.model.player_not_cards:
-                    self.model.player_not_cards[player_name] = set()
-                self.model.player_not_cards[player_name].add(card_name)
+                self.model._mark_not_holding(player_name, accusation[card_type])
             
             # Update the model
             self.model._update_probabilities()
@@ -121,7 +159,7 @@ class LearningModule:
             card: The card that was shown
         """
         # Record that we've seen this card
-        self.model.seen_cards.add(card.name if hasattr(card, 'name') else str(card))
+        self.model.seen_cards.add(_card_name(card))
         
         # Update the model
         self.model.update_from_card_reveal(card, player_name)
@@ -137,19 +175,27 @@ class LearningModule:
             game_state: The current CluedoGame instance
         """
         try:
-            # Update based on all players' known cards
-            for player in game_state.get_all_players():
-                if hasattr(player, 'hand') and player.hand:
-                    for card in player.hand:
-                        self.model.update_from_card_reveal(card, player.name)
+            players = list(game_state.get_all_players())
+            entries = (list(self._history_entries(game_state.suggestion_history))
+                       if hasattr(game_state, 'suggestion_history') else [])
             
-            # Update from the suggestion history
-            if hasattr(game_state, 'suggestion_history'):
-                # Use get_all() if available, otherwise access records directly
-                history_entries = getattr(game_state.suggestion_history, 'get_all', 
-                                       lambda: getattr(game_state.suggestion_history, 'records', []))()
+            # Evidence already folded in leaves the model unchanged, so skip
+            # the whole pass when nothing has been dealt or suggested since
+            key = self._evidence_key(game_state, players, entries)
+            if key == self._belief_key:
+                return
+            
+            # Record all evidence first and recompute the posteriors once
+            self.model.begin_batch()
+            try:
+                # Update based on all players' known cards
+                for player in players:
+                    if hasattr(player, 'hand') and player.hand:
+                        for card in player.hand:
+                            self.model.update_from_card_reveal(card, player.name)
                 
-                for entry in history_entries:
+                # Update from the suggestion history
+                for entry in entries:
                     refuting_player = entry.get('refuting_player')
                     if refuting_player:
                         # Create a suggestion dictionary in the expected format
@@ -163,14 +209,14 @@ class LearningModule:
                             suggestion,
                             entry.get('shown_card')
                         )
-            
-            # Update the model's probabilities
-            self.model._update_probabilities()
+            finally:
+                # Update the model's probabilities
+                self.model.end_batch()
+            self._belief_key = key
             
         except Exception as e:
             # Log any errors but don't crash the game
-            import logging
-            logging.error(f"Error updating belief state: {e}", exc_info=True)
+            logger.error(f"Error updating belief state: {e}", exc_info=True)
     
     def update_from_game_state(self, game_state: Any):
         """
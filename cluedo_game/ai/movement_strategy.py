@@ -7,16 +7,42 @@ This module handles all movement-related decisions, including:
 - Room value assessment
 """
 
-from typing import List, Dict, Any, Optional, Set, Tuple, Union
-import random
+import logging
+from typing import List, Dict, Any, Optional, Set, Tuple, Sequence, Callable
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+
+import numpy as np
 
 from cluedo_game.cards import RoomCard
-from cluedo_game.mansion import Room
-from .bayesian_model import BayesianModel
+from cluedo_game.mansion import PosKind, space_kind
+from .bayesian_model import BayesianModel, _DATACLASS_SLOTS, _card_name
+from ._kernels import score_destinations
+
+logger = logging.getLogger(__name__)
+
+# Corridors near the centre of the board, slightly preferred when moving
+_CENTER_CORRIDORS = frozenset({'C6', 'C7', 'C8'})
+
+
+@lru_cache(maxsize=256)
+def _adjacent_rooms_cached(mansion: Any, position: Any) -> Tuple:
+    """
+    Return the rooms adjacent to a position on a given mansion.
+    
+    The mansion layout is static for the whole game, so results are memoized
+    per (mansion, position) pair.
+    """
+    return tuple(mansion.get_adjacent_rooms(position))
 
 
-@dataclass
+def _no_adjacent_rooms(position: Any) -> Tuple:
+    """Adjacency lookup for game states that expose no board layout."""
+    return ()
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MovementStrategy:
     """
     Handles movement decisions for the Nash AI player.
@@ -30,6 +56,22 @@ class MovementStrategy:
     model: BayesianModel
     visited_rooms: Set[str] = field(default_factory=set)
     
+    # Most recent visits, oldest first; mirrored by visited_rooms for lookups
+    _visited_deque: deque = field(default_factory=lambda: deque(maxlen=3), init=False, repr=False)
+    
+    # Source of the tie-breaking noise added to destination scores
+    _rng: np.random.Generator = field(default_factory=np.random.default_rng, init=False, repr=False)
+    
+    # Adjacency lookup resolved for _adj_source, the game state last seen
+    _adj_fn: Optional[Callable[[Any], Sequence[str]]] = field(default=None, init=False, repr=False)
+    _adj_source: Any = field(default=None, init=False, repr=False)
+    
+    def reset_game_state(self):
+        """Forget adjacency resolved for the previous game; call when a new game starts."""
+        self._adj_fn = None
+        self._adj_source = None
+        _adjacent_rooms_cached.cache_clear()
+    
     def choose_destination(self, current_position: str, 
                          destinations: List[str], 
                          game_state: Any) -> str:
@@ -50,161 +92,80 @@ class MovementStrategy:
         if len(destinations) == 1:
             return destinations[0]
         
-        # Score each destination
-        scored_destinations = []
-        for dest in destinations:
-            score = self._calculate_destination_score(dest, current_position, game_state)
-            scored_destinations.append((dest, score))
-        
-        # Sort by score (descending)
-        scored_destinations.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return the best destination
-        return scored_destinations[0][0]
-    
-    def _calculate_destination_score(self, destination: Union[str, Room], 
-                                   current_position: Union[str, Room],
-                                   game_state: Any) -> float:
-        """
-        Calculate a score for a potential destination.
-        
-        Args:
-            destination: The destination to score (can be a Room object or corridor string)
-            current_position: Current position of the AI player (can be a Room object or corridor string)
-            game_state: Current game state object
-            
-        Returns:
-            float: Score for this destination (higher is better)
-        """
-        score = 0.0
-        
-        # Handle case where destination is a Room object
-        if isinstance(destination, Room):
-            room_name = destination.name
-            score += self._score_room_destination(room_name, game_state)
-        # Handle case where destination is a corridor (string starting with 'C')
-        elif isinstance(destination, str) and destination.startswith('C'):
-            # For current_position, convert to string if it's a Room object
-            current_pos_str = current_position.name if isinstance(current_position, Room) else current_position
-            score += self._score_corridor_destination(destination, current_pos_str, game_state)
-        else:
-            # Fallback for any other case
-            try:
-                # Try to get the name if it's an object with a name attribute
-                room_name = getattr(destination, 'name', str(destination))
-                score += self._score_room_destination(room_name, game_state)
-            except Exception:
-                # If all else fails, log a warning and return a neutral score
-                import logging
-                logging.warning(f"Could not determine destination type: {destination}")
-                return 0.5
+        n = len(destinations)
+        names = [_card_name(dest) for dest in destinations]
+        probs = self.model.get_room_probs(names)
+        
+        # Endgame: head straight for a room that is almost certainly the answer
+        best = int(np.argmax(probs))
+        if probs[best] > 0.9:
+            return destinations[best]
+        
+        # Flags for the scoring kernel
+        is_corridor = np.fromiter((space_kind(name) is PosKind.CORRIDOR for name in names),
+                                  dtype=bool, count=n)
+        visited = np.fromiter((name in self.visited_rooms for name in names), dtype=bool, count=n)
+        center = np.fromiter((name in _CENTER_CORRIDORS for name in names), dtype=bool, count=n)
+        
+        # Unvisited rooms next to each destination, flattened with per-destination offsets
+        adj_names = []
+        adj_offsets = [0]
+        for name in names:
+            for adj_room in self._get_adjacent_rooms(name, game_state):
+                adj_name = _card_name(adj_room)
+                if adj_name not in self.visited_rooms:
+                    adj_names.append(adj_name)
+            adj_offsets.append(len(adj_names))
+        
+        scores = score_destinations(
+            probs, visited, is_corridor, center,
+            self.model.get_room_probs(adj_names), np.asarray(adj_offsets, dtype=np.int64)
+        )
         
         # Add some randomness to avoid predictable behavior
-        score += random.uniform(0, 0.1)
-        
-        return score
-    
-    def _score_room_destination(self, room: Union[str, Room], game_state: Any) -> float:
-        """
-        Calculate a score for moving to a room.
-        
-        Args:
-            room: The room to score (can be a Room object or room name string)
-            game_state: Current game state object
-            
-        Returns:
-            float: Score for this room (higher is better)
-        """
-        score = 0.0
-        
-        # Get room name if it's a Room object
-        room_name = room.name if hasattr(room, 'name') else str(room)
-        
-        # Base score for any room
-        score += 50.0
-        
-        # Check if we've been here recently
-        if room_name in self.visited_rooms:
-            score -= 20.0  # Penalty for recently visited rooms
+        scores += self._rng.uniform(0, 0.1, size=n)
         
-        # Get room probability from the model
-        room_prob = self.model.get_card_probability('rooms', room_name)
-        
-        # Higher score for rooms we're less certain about
-        # (Maximum uncertainty at p=0.5)
-        uncertainty = 1.0 - abs(room_prob - 0.5) * 2.0
-        score += uncertainty * 30.0
-        
-        # Check if this room is adjacent to other interesting rooms
-        adjacent_rooms = self._get_adjacent_rooms(room_name, game_state)
-        for adj_room in adjacent_rooms:
-            if adj_room not in self.visited_rooms:
-                adj_prob = self.model.get_card_probability('rooms', adj_room)
-                score += (1.0 - adj_prob) * 10.0
-        
-        return score
+        # Return the best destination
+        return destinations[int(np.argmax(scores))]
     
-    def _score_corridor_destination(self, corridor: str, 
-                                  current_position: Union[str, Room],
-                                  game_state: Any) -> float:
+    def _get_adjacent_rooms(self, position: str, game_state: Any) -> Sequence[str]:
         """
-        Calculate a score for moving to a corridor.
+        Get rooms adjacent to a given position.
         
         Args:
-            corridor: The corridor to score (should be a string like 'C1', 'C2', etc.)
-            current_position: Current position of the AI player (can be a Room object or corridor string)
+            position: Current position (room or corridor)
             game_state: Current game state object
             
         Returns:
-            float: Score for this corridor (higher is better)
+            List of adjacent room names
         """
-        score = 0.0
-        
-        # Base score for any corridor
-        score += 30.0
-        
-        # Handle case where current_position is a Room object
-        current_pos_str = current_position.name if hasattr(current_position, 'name') else str(current_position)
-        
-        # Check adjacent rooms to this corridor
-        adjacent_rooms = self._get_adjacent_rooms(corridor, game_state)
-        
-        # Score based on adjacent rooms
-        for room in adjacent_rooms:
-            if room not in self.visited_rooms:
-                room_prob = self.model.get_card_probability('rooms', room)
-                # Higher score for corridors near uncertain rooms
-                score += (1.0 - room_prob) * 15.0
-        
-        # Slight preference for corridors near the center of the board
-        if corridor in ['C6', 'C7', 'C8']:
-            score += 5.0
-            
-        return score
+        try:
+            if self._adj_fn is None or game_state is not self._adj_source:
+                self._adj_fn = self._resolve_adjacency(game_state)
+                self._adj_source = game_state
+            return self._adj_fn(position)
+        except Exception:
+            # Fallback if we can't determine adjacency
+            return []
     
-    def _get_adjacent_rooms(self, position: str, game_state: Any) -> List[str]:
+    @staticmethod
+    def _resolve_adjacency(game_state: Any) -> Callable[[Any], Sequence[str]]:
         """
-        Get rooms adjacent to a given position.
+        Find the adjacency lookup a game state provides.
         
         Args:
-            position: Current position (room or corridor)
             game_state: Current game state object
             
         Returns:
-            List of adjacent room names
+            Callable mapping a position to its adjacent rooms
         """
-        try:
-            if hasattr(game_state, 'mansion') and hasattr(game_state.mansion, 'get_adjacent_rooms'):
-                return game_state.mansion.get_adjacent_rooms(position)
-            elif hasattr(game_state, 'board') and hasattr(game_state.board, 'get_adjacent_rooms'):
-                return game_state.board.get_adjacent_rooms(position)
-            elif hasattr(game_state, 'get_adjacent_rooms'):
-                return game_state.get_adjacent_rooms(position)
-        except Exception:
-            pass
-            
-        # Fallback if we can't determine adjacency
-        return []
+        if hasattr(game_state, 'mansion') and hasattr(game_state.mansion, 'get_adjacent_rooms'):
+            return partial(_adjacent_rooms_cached, game_state.mansion)
+        elif hasattr(game_state, 'board') and hasattr(game_state.board, 'get_adjacent_rooms'):
+            return game_state.board.get_adjacent_rooms
+        elif hasattr(game_state, 'get_adjacent_rooms'):
+            return game_state.get_adjacent_rooms
+        return _no_adjacent_rooms
     
     def record_room_visit(self, room: str):
         """
@@ -213,9 +174,13 @@ class MovementStrategy:
         Args:
             room: Name of the room that was visited
         """
+        recent = self._visited_deque
+        if room in recent:
+            # Revisit: move the room to the most recent slot
+            recent.remove(room)
+        elif len(recent) == recent.maxlen:
+            # Keep only the most recent 3 rooms
+            self.visited_rooms.discard(recent.popleft())
+        
+        recent.append(room)
         self.visited_rooms.add(room)
-        
-        # Keep only the most recent 3 rooms
-        if len(self.visited_rooms) > 3:
-            # Convert to list, keep last 3, convert back to set
-            self.visited_rooms = set(list(self.visited_rooms)[-3:])
@@ -4,16 +4,18 @@ Nash Equilibrium-based AI player implementation for Cluedo.
 This is the main class that integrates all AI components for the Nash AI player.
 """
 
+import traceback
 from typing import Optional, Dict, List, Any, Set
 from collections import defaultdict
 
 from cluedo_game.character import Character
-from cluedo_game.cards import SuspectCard, WeaponCard, RoomCard, get_suspects, get_weapons, get_rooms
+from cluedo_game.cards import Card, SuspectCard, WeaponCard, RoomCard
 from cluedo_game.player import Player
+from cluedo_game.mansion import PosKind, Room, space_kind
 
 # Import AI modules
 from .bayesian_model import BayesianModel
-from .suggestion_engine import SuggestionEngine
+from .suggestion_engine import SuggestionEngine, _SUSPECT_NAMES, _WEAPON_NAMES, _ROOM_NAMES
 from .movement_strategy import MovementStrategy
 from .learning import LearningModule
 from .utils import get_card_type, format_suggestion
@@ -21,6 +23,13 @@ from .utils import get_card_type, format_suggestion
 # Global flag to detect test mode
 IN_TEST_MODE = False  # Set to True when running tests
 
+# Announcement of an AI suggestion and its outcome
+_SUGGESTION_MSG = "{} suggests {} with the {} in the {}. {}."
+
+
+def _noop(*args, **kwargs):
+    """Output sink for batch and simulation runs; AI players skip building messages for it."""
+
 
 class NashAIPlayer(Player):
     """
@@ -34,6 +43,14 @@ class NashAIPlayer(Player):
     4. LearningModule: Processes game events and updates knowledge
     """
     
+    # Whether the current position is a corridor; kept in step with position
+    _in_corridor = False
+    
+    @Player.position.setter
+    def position(self, value):
+        Player.position.fset(self, value)
+        self._in_corridor = value is not None and space_kind(value) is PosKind.CORRIDOR
+    
     @classmethod
     def set_test_mode(cls, is_test_mode=True):
         """
@@ -54,6 +71,8 @@ class NashAIPlayer(Player):
         """
         super().__init__(character, is_human=False)
         self.game = game  # Store reference to the game object
+        # Game hooks are resolved on the first turn, once the game is set up
+        self._bind_game_api(None)
         
         # Set the initial position from the character
         if hasattr(character, 'position'):
@@ -84,38 +103,76 @@ class NashAIPlayer(Player):
         self.belief_state = {}
         self.card_posteriors = self.model.posteriors
         self.card_priors = self.model.priors
-        self.information_value = defaultdict(dict)  # Will be populated as needed
+        self._information_value = None  # Created on first use
+        
+        # Accusation confidence and the model version it was computed for
+        self._last_conf = 0.0
+        self._last_conf_version = -1
         
         # Ensure card_probabilities is initialized for test compatibility
-        # Import here to avoid circular imports
-        from cluedo_game.cards import get_suspects, get_weapons, get_rooms
+        for card_type, names in (('suspects', _SUSPECT_NAMES),
+                                 ('weapons', _WEAPON_NAMES),
+                                 ('rooms', _ROOM_NAMES)):
+            self.card_probabilities[card_type].update(dict.fromkeys(names, 0.0))
+    
+    @property
+    def information_value(self):
+        """Per-card information values (kept for backward compatibility)."""
+        if self._information_value is None:
+            self._information_value = defaultdict(dict)
+        return self._information_value
+    
+    @information_value.setter
+    def information_value(self, value):
+        self._information_value = value
+    
+    def _bind_game_api(self, game):
+        """
+        Resolve the optional game hooks used during a turn.
         
-        # Pre-initialize with empty dictionaries
-        suspects = get_suspects()
-        for suspect in suspects:
-            name = suspect.name if hasattr(suspect, 'name') else suspect
-            self.card_probabilities['suspects'][name] = 0.0
-            
-        weapons = get_weapons()
-        for weapon in weapons:
-            name = weapon.name if hasattr(weapon, 'name') else weapon
-            self.card_probabilities['weapons'][name] = 0.0
-            
-        rooms = get_rooms()
-        for room in rooms:
-            name = room.name if hasattr(room, 'name') else room
-            self.card_probabilities['rooms'][name] = 0.0
+        The game object does not change during a turn, so its output function,
+        refutation handler, movement lookup and history are looked up once per
+        game rather than probed with hasattr on every turn.
+        """
+        self._api_game = game
+        # Games that are not verbose (e.g. headless simulations) get no
+        # narration, so no messages are built for them
+        output = getattr(game, 'output', None)
+        verbose = getattr(game, 'verbose', True)
+        if output is _noop or not verbose or not callable(output):
+            output = None
+        self._api_output = output
+        handle_refutation = getattr(game, 'handle_refutation', None)
+        self._api_handle_refutation = handle_refutation if callable(handle_refutation) else None
+        self._api_get_dests = getattr(getattr(game, 'movement', None), 'get_destinations_from', None)
+        self._api_history_add = getattr(getattr(game, 'suggestion_history', None), 'add', None)
+    
+    @property
+    def character(self):
+        """The character card this AI plays as."""
+        return self._character
+    
+    @character.setter
+    def character(self, value):
+        self._character = value
+        # The display name is read on every log line, so build it once here
+        self._name = f"{value.name} (AI)"
     
     @property
     def name(self):
         """Get the player's name with (AI) suffix for clarity."""
-        return f"{self.character.name} (AI)"
+        return self._name
     
     @name.setter
     def name(self, value):
         """Set the player's name (for test compatibility)."""
-        if hasattr(self.character, 'name'):
+        if isinstance(self.character, Card):
+            # Cards hash by name and may be shared, so swap in a new card
+            # rather than renaming this one
+            self.character = type(self.character)(value)
+        elif hasattr(self.character, 'name'):
             self.character.name = value
+            self._name = f"{value} (AI)"
     
     def take_turn(self, game=None):
         """
@@ -136,31 +193,61 @@ class NashAIPlayer(Player):
         game = game or self.game
         if game is None:
             raise ValueError("No game provided and no game attribute set")
+        if game is not self._api_game:
+            self._bind_game_api(game)
         
         # 1. Movement Phase
         self._handle_movement_phase(game)
         
-        # 2. Suggestion Phase (if in a room)
-        if not str(self.position).startswith('C'):  # Not in a corridor
+        # 2. and 3. Suggestion and Accusation Phases
+        return self.finish_turn(game)
+    
+    def finish_turn(self, game) -> bool:
+        """
+        Finish a turn once the AI has moved: suggest if in a room, then
+        accuse if confident.
+        
+        Args:
+            game: The game being played
+            
+        Returns:
+            bool: True if the AI made a correct accusation, False otherwise
+        """
+        if game is not self._api_game:
+            self._bind_game_api(game)
+        
+        # Suggestion Phase (if in a room)
+        if not self._in_corridor:
             self._handle_suggestion_phase(game)
         
-        # 3. Accusation Phase (if confident)
+        # Accusation Phase (if confident)
         if self._should_make_accusation():
             return self._make_accusation(game)
             
         return False
     
+    def learn_own_hand(self) -> None:
+        """Record the cards dealt to this AI as held by it."""
+        self.model.begin_batch()
+        try:
+            for card in self.hand:
+                self.model.update_from_card_reveal(card, self.name)
+        finally:
+            self.model.end_batch()
+    
     def _handle_movement_phase(self, game):
         """Handle the movement phase of the turn."""
         try:
             # Get dice roll and possible destinations
             dice_roll = getattr(game, 'dice_roll', 1)
             
-            if not hasattr(game, 'movement') or not hasattr(game.movement, 'get_destinations_from'):
+            if game is not self._api_game:
+                self._bind_game_api(game)
+            if self._api_get_dests is None:
                 print("[DEBUG] Game is missing movement or get_destinations_from method")
                 return False
                 
-            destinations = game.movement.get_destinations_from(self.position, dice_roll)
+            destinations = self._api_get_dests(self.position, dice_roll)
             if not destinations:  # No valid moves
                 return False
                 
@@ -172,18 +259,17 @@ class NashAIPlayer(Player):
             # For AI players, update position directly without going through move_player
             # to avoid the interactive prompt
             old_pos = self.position
+            was_in_corridor = self._in_corridor
             self.position = chosen_destination
             
             # Log the movement
-            if hasattr(game, 'output'):
+            if self._api_output is not None:
                 chess_coord = game.mansion.get_chess_coordinate(chosen_destination)
                 from_chess = game.mansion.get_chess_coordinate(old_pos)
-                game.output(f"{self.name} moves from {old_pos} [{from_chess}] to {chosen_destination} [{chess_coord}]")
+                self._api_output(f"{self.name} moves from {old_pos} [{from_chess}] to {chosen_destination} [{chess_coord}]")
             
             # Update last_door_passed if moving from a room to a corridor
-            if (not str(old_pos).startswith('C') and 
-                hasattr(chosen_destination, 'startswith') and 
-                chosen_destination.startswith('C')):
+            if not was_in_corridor and self._in_corridor:
                 if hasattr(game, 'last_door_passed'):
                     game.last_door_passed[self.name] = old_pos
             
@@ -191,17 +277,19 @@ class NashAIPlayer(Player):
             
         except Exception as e:
             error_msg = f"[DEBUG] Error in movement phase: {str(e)}"
-            if hasattr(game, 'output'):
-                game.output(error_msg)
+            if self._api_output is not None:
+                self._api_output(error_msg)
             else:
                 print(error_msg)
-            import traceback
             traceback.print_exc()
             return False
     
     def _handle_suggestion_phase(self, game):
         """Handle the suggestion phase of the turn."""
         try:
+            if game is not self._api_game:
+                self._bind_game_api(game)
+            
             # Generate a suggestion
             suggestion = self.suggestion_engine.make_suggestion(self.position, game)
             if not suggestion:
@@ -211,11 +299,12 @@ class NashAIPlayer(Player):
             refuting_player = None
             shown_card = None
             
-            if hasattr(game, 'handle_refutation') and callable(game.handle_refutation):
-                refuting_player, shown_card = game.handle_refutation(
+            if self._api_handle_refutation is not None:
+                refuting_player, shown_card = self._api_handle_refutation(
                     suggestion['character'], 
                     suggestion['weapon'], 
-                    suggestion['room']
+                    suggestion['room'],
+                    self
                 )
                 
                 # Update knowledge based on refutation
@@ -233,53 +322,58 @@ class NashAIPlayer(Player):
             
         except Exception as e:
             print(f"[DEBUG] Error in suggestion phase: {str(e)}")
-            import traceback
             traceback.print_exc()
     
     def _log_suggestion(self, game, suggestion, refuting_player, shown_card):
         """Log the suggestion to the game's history if available."""
         try:
-            if hasattr(game, 'suggestion_history') and hasattr(game.suggestion_history, 'add'):
-                game.suggestion_history.add(
-                    self.name, 
-                    suggestion['character'].name, 
-                    suggestion['weapon'].name, 
-                    suggestion['room'], 
+            if game is not self._api_game:
+                self._bind_game_api(game)
+            name = self.name
+            character = suggestion['character'].name
+            weapon = suggestion['weapon'].name
+            room = suggestion['room']
+            if self._api_history_add is not None:
+                self._api_history_add(
+                    name, 
+                    character, 
+                    weapon, 
+                    room, 
                     refuting_player, 
                     shown_card
                 )
                 
-            if hasattr(game, 'output') and callable(game.output):
+            if self._api_output is not None:
                 refute_info = f"Refuted by {refuting_player} with {shown_card}" if refuting_player else "No one could refute"
-                game.output(
-                    f"{self.name} suggests {suggestion['character'].name} with the "
-                    f"{suggestion['weapon'].name} in the {suggestion['room']}. {refute_info}."
-                )
+                self._api_output(_SUGGESTION_MSG.format(name, character, weapon, room, refute_info))
         except Exception as e:
             print(f"[DEBUG] Error logging suggestion: {str(e)}")
     
     def _should_make_accusation(self) -> bool:
         """Determine if we should make an accusation based on our confidence."""
-        # Get the most likely solution
-        solution = self.model.get_most_likely_solution()
-        
-        # Calculate confidence as product of probabilities
-        confidence = 1.0
-        confidence *= self.model.get_card_probability('suspects', solution['character'])
-        confidence *= self.model.get_card_probability('weapons', solution['weapon'])
-        confidence *= self.model.get_card_probability('rooms', solution['room'])
+        if self._last_conf_version != self.model.version:
+            # Get the most likely solution
+            solution = self.model.get_most_likely_solution()
+            
+            # Calculate confidence as product of probabilities
+            confidence = 1.0
+            confidence *= self.model.get_card_probability('suspects', solution['character'])
+            confidence *= self.model.get_card_probability('weapons', solution['weapon'])
+            confidence *= self.model.get_card_probability('rooms', solution['room'])
+            
+            self._last_conf = confidence
+            self._last_conf_version = self.model.version
         
         # Only accuse if we're very confident (above 90%)
-        return confidence > 0.9
+        return self._last_conf > 0.9
     
     def _make_accusation(self, game) -> bool:
         """Make an accusation based on our current beliefs."""
         accusation = self.model.get_most_likely_solution()
+        if game is not self._api_game:
+            self._bind_game_api(game)
         
         # Get the actual card objects
-        from cluedo_game.cards import SuspectCard, WeaponCard
-        from cluedo_game.mansion import Room
-        
         try:
             character = (
                 SuspectCard(accusation['character']) 
@@ -300,10 +394,10 @@ class NashAIPlayer(Player):
             # Make the accusation
             correct = game.make_accusation(self, character, weapon, room)
             
-            if correct and hasattr(game, 'output') and callable(game.output):
-                game.output(f"\n{self.name} wins!")
+            if correct and self._api_output is not None:
+                self._api_output(f"\n{self.name} wins!")
                 if hasattr(game, 'solution') and game.solution:
-                    game.output(
+                    self._api_output(
                         f"The solution was: {game.solution.character.name} with the "
                         f"{game.solution.weapon.name} in the {game.solution.room}."
                     )
@@ -312,7 +406,6 @@ class NashAIPlayer(Player):
             
         except Exception as e:
             print(f"[DEBUG] Error making accusation: {str(e)}")
-            import traceback
             traceback.print_exc()
             return False
 
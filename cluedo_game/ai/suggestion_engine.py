@@ -5,11 +5,35 @@ This module handles generating optimal suggestions based on the current game sta
 and the AI's belief model.
 """
 
-import random
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Any, Tuple
 
-from cluedo_game.cards import SuspectCard, WeaponCard, RoomCard, Card
-from .bayesian_model import BayesianModel
+import numpy as np
+
+from cluedo_game.cards import SuspectCard, WeaponCard, RoomCard, Card, get_suspects, get_weapons, get_rooms
+from .bayesian_model import BayesianModel, _DATACLASS_SLOTS
+
+# Candidate cards and their names, fixed for the whole game
+_ALL_SUSPECTS = tuple(get_suspects())
+_ALL_WEAPONS = tuple(get_weapons())
+_SUSPECT_NAMES = tuple(suspect.name for suspect in _ALL_SUSPECTS)
+_WEAPON_NAMES = tuple(weapon.name for weapon in _ALL_WEAPONS)
+_ROOM_NAMES = tuple(get_rooms())
+_SUSPECT_BY_NAME = {suspect.name: suspect for suspect in _ALL_SUSPECTS}
+_WEAPON_BY_NAME = {weapon.name: weapon for weapon in _ALL_WEAPONS}
+
+# Suggest the most likely solution once the geometric mean of its card
+# probabilities exceeds 0.8, i.e. once their product exceeds 0.8 ** 3
+_CONFIDENT_PRODUCT = 0.8 ** 3
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class SuggestionRecord:
+    """A suggestion and its outcome, as kept in the suggestion history."""
+    player: str
+    suggestion: Dict[str, Any]
+    refuting_player: Optional[str] = None
+    shown_card: Optional[Card] = None
 
 
 class SuggestionEngine:
@@ -22,6 +46,8 @@ class SuggestionEngine:
     - Tracking suggestion history
     """
     
+    __slots__ = ('model', 'suggestion_history', '_confidence', '_confidence_version')
+    
     def __init__(self, model: BayesianModel):
         """
         Initialize the suggestion engine with a reference to the Bayesian model.
@@ -32,6 +58,11 @@ class SuggestionEngine:
         self.model = model
         self.suggestion_history = []
         
+        # Product of the most likely solution's card probabilities and the
+        # model version it was computed for
+        self._confidence = 0.0
+        self._confidence_version = -1
+        
     def make_suggestion(self, current_room: str, game_state: Any) -> Dict[str, Any]:
         """
         Generate an optimal suggestion based on current knowledge.
@@ -43,67 +74,63 @@ class SuggestionEngine:
         Returns:
             Dictionary with 'character', 'weapon', and 'room' keys
         """
-        # Get all possible suspects and weapons
-        from cluedo_game.cards import get_suspects, get_weapons
-        all_suspects = get_suspects()
-        all_weapons = get_weapons()
-        
-        # Calculate solution confidence
-        solution_confidence = self._calculate_solution_confidence()
+        all_suspects = _ALL_SUSPECTS
+        all_weapons = _ALL_WEAPONS
         
         # If we're confident in our solution, suggest those cards
-        if solution_confidence > 0.8:
+        confidence_product = self._solution_confidence_product()
+        if confidence_product > _CONFIDENT_PRODUCT:
             solution = self.model.get_most_likely_solution()
             return {
-                'character': next(s for s in all_suspects if s.name == solution['character']),
-                'weapon': next(w for w in all_weapons if w.name == solution['weapon']),
+                'character': _SUSPECT_BY_NAME[solution['character']],
+                'weapon': _WEAPON_BY_NAME[solution['weapon']],
                 'room': current_room
             }
         
-        # Otherwise, make an information-gathering suggestion
-        best_score = float('-inf')
-        best_suggestion = None
-        
-        for suspect in all_suspects:
-            for weapon in all_weapons:
-                # Skip combinations we've already seen
-                if (suspect.name in self.model.seen_cards and 
-                    weapon.name in self.model.seen_cards):
-                    continue
-                
-                # Calculate score based on information value and probability
-                info_score = self._calculate_information_value(suspect, weapon, current_room)
-                prob_score = self._calculate_probability_score(suspect, weapon, current_room)
-                
-                # Weight information value higher when less confident
-                w1 = solution_confidence  # Weight for probability
-                w2 = 1.0 - solution_confidence  # Weight for information
-                
-                total_score = (w1 * prob_score) + (w2 * info_score)
-                
-                # Add bonus for cards we've never seen before
-                if suspect.name not in self.model.seen_cards:
-                    total_score += 0.2
-                if weapon.name not in self.model.seen_cards:
-                    total_score += 0.2
-                
-                if total_score > best_score:
-                    best_score = total_score
-                    best_suggestion = {
-                        'character': suspect,
-                        'weapon': weapon,
-                        'room': current_room
-                    }
-        
-        # Fallback to random suggestion if no good one found
-        if not best_suggestion:
-            best_suggestion = {
-                'character': random.choice(all_suspects),
-                'weapon': random.choice(all_weapons),
+        # Otherwise, make an information-gathering suggestion: score every
+        # suspect x weapon pair at once
+        p_s = self.model.get_card_probs('suspects', _SUSPECT_NAMES)
+        p_w = self.model.get_card_probs('weapons', _WEAPON_NAMES)
+        p_r = self.model.get_card_probability('rooms', current_room)
+        unseen_s = ~self.model.get_seen_flags('suspects', _SUSPECT_NAMES)
+        unseen_w = ~self.model.get_seen_flags('weapons', _WEAPON_NAMES)
+        
+        # Weight information value higher when less confident
+        solution_confidence = confidence_product ** (1/3)  # Geometric mean
+        w1 = solution_confidence  # Weight for probability
+        w2 = 1.0 - solution_confidence  # Weight for information
+        
+        # Information value is higher for unseen cards we know less about, and
+        # cards we've never seen get a bonus. Both depend on only one card of
+        # the pair, so they are computed per suspect and per weapon
+        s_terms = (w2 * 0.5 * (1.0 - p_s) + 0.2) * unseen_s
+        w_terms = (w2 * 0.5 * (1.0 - p_w) + 0.2) * unseen_w
+        
+        # Probability score is the joint probability (naive Bayes assumption);
+        # the room factor and weight are folded into the suspect column
+        total_score = np.multiply.outer((w1 * p_r) * p_s, p_w)
+        total_score += s_terms[:, None]
+        total_score += w_terms[None, :]
+        
+        # Skip combinations we've already seen
+        total_score[~(unseen_s[:, None] | unseen_w[None, :])] = -np.inf
+        
+        best = int(np.argmax(total_score))
+        if np.isfinite(total_score.flat[best]):
+            i, j = np.unravel_index(best, total_score.shape)
+            return {
+                'character': all_suspects[i],
+                'weapon': all_weapons[j],
                 'room': current_room
             }
         
-        return best_suggestion
+        # Every pair has been seen: fall back to the least likely cards,
+        # which are the ones we learn the most from having confirmed
+        return {
+            'character': all_suspects[int(np.argmin(p_s))],
+            'weapon': all_weapons[int(np.argmin(p_w))],
+            'room': current_room
+        }
     
     def evaluate_suggestion_quality(self, suggestion: Dict[str, Any]) -> float:
         """
@@ -143,12 +170,9 @@ class SuggestionEngine:
             refuting_player: Name of the player who refuted, if any
             shown_card: The card that was shown, if any
         """
-        self.suggestion_history.append({
-            'player': player,
-            'suggestion': suggestion,
-            'refuting_player': refuting_player,
-            'shown_card': shown_card
-        })
+        self.suggestion_history.append(
+            SuggestionRecord(player, suggestion, refuting_player, shown_card)
+        )
     
     def _calculate_information_value(self, suspect, weapon, room) -> float:
         """
@@ -202,6 +226,19 @@ class SuggestionEngine:
         Returns:
             float: Confidence score between 0 and 1
         """
+        return self._solution_confidence_product() ** (1/3)  # Geometric mean
+    
+    def _solution_confidence_product(self) -> float:
+        """
+        Calculate the product of the most likely solution's card probabilities.
+        
+        Returns:
+            float: Product between 0 and 1
+        """
+        # Reuse the last result while the belief state is unchanged
+        if self._confidence_version == self.model.version:
+            return self._confidence
+        
         # Get the most likely solution
         solution = self.model.get_most_likely_solution()
         
@@ -211,4 +248,6 @@ class SuggestionEngine:
         confidence *= self.model.get_card_probability('weapons', solution['weapon'])
         confidence *= self.model.get_card_probability('rooms', solution['room'])
         
-        return confidence ** (1/3)  # Geometric mean
+        self._confidence = confidence
+        self._confidence_version = self.model.version
+        return self._confidence
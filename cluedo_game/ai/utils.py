@@ -4,10 +4,11 @@ Utility functions and constants for the Nash AI player.
 This module contains shared functionality used across multiple AI components.
 """
 
-import math
 from typing import Dict, List, Any, Set, Optional, Tuple, Union
 
-from cluedo_game.cards import Card, SuspectCard, WeaponCard, RoomCard
+import numpy as np
+
+from cluedo_game.cards import Card, SuspectCard, WeaponCard, RoomCard, get_rooms, get_weapons
 
 # Constants for game rules
 MAX_PLAYERS = 6
@@ -18,6 +19,10 @@ CARDS_PER_PLAYER = {
     6: 3,  # 6 players: 3 cards each
 }
 
+# Lower-cased room and weapon names for classifying cards given by name
+_ROOM_NAMES_LC = frozenset(room.lower() for room in get_rooms())
+_WEAPON_NAMES_LC = frozenset(weapon.name.lower() for weapon in get_weapons())
+
 def normalize_probabilities(prob_dict: Dict[Any, float]) -> Dict[Any, float]:
     """
     Normalize a dictionary of probabilities to sum to 1.0.
@@ -28,12 +33,27 @@ def normalize_probabilities(prob_dict: Dict[Any, float]) -> Dict[Any, float]:
     Returns:
         Dict with normalized probabilities
     """
-    total = sum(prob_dict.values())
+    values = np.fromiter(prob_dict.values(), dtype=np.float64, count=len(prob_dict))
+    return dict(zip(prob_dict.keys(), normalize_probabilities_from_array(values).tolist()))
+
+def normalize_probabilities_from_array(values: np.ndarray) -> np.ndarray:
+    """
+    Normalize an array of probabilities to sum to 1.0.
+    
+    Args:
+        values: Array of probabilities
+        
+    Returns:
+        np.ndarray: New array with normalized probabilities
+    """
+    values = np.array(values, dtype=np.float64)
+    total = values.sum()
     if total > 0:
-        return {k: v / total for k, v in prob_dict.items()}
-    # If all probabilities are zero, return uniform distribution
-    n = len(prob_dict)
-    return {k: 1.0 / n for k in prob_dict.keys()}
+        values /= total
+    elif values.size:
+        # If all probabilities are zero, return uniform distribution
+        values.fill(1.0 / values.size)
+    return values
 
 def calculate_entropy(prob_dict: Dict[Any, float]) -> float:
     """
@@ -45,11 +65,22 @@ def calculate_entropy(prob_dict: Dict[Any, float]) -> float:
     Returns:
         float: Entropy in bits
     """
-    entropy = 0.0
-    for p in prob_dict.values():
-        if p > 0:
-            entropy -= p * math.log2(p)
-    return entropy
+    values = np.fromiter(prob_dict.values(), dtype=np.float64, count=len(prob_dict))
+    return calculate_entropy_from_array(values)
+
+def calculate_entropy_from_array(values: np.ndarray) -> float:
+    """
+    Calculate the entropy of a probability distribution given as an array.
+    
+    Args:
+        values: Array of probabilities
+        
+    Returns:
+        float: Entropy in bits
+    """
+    p = np.asarray(values, dtype=np.float64)
+    p = p[p > 0]
+    return float((p * -np.log2(p)).sum())
 
 def get_unknown_cards(seen_cards: Set[str], all_cards: List[Card]) -> List[Card]:
     """
@@ -82,13 +113,12 @@ def get_card_type(card: Union[Card, str]) -> str:
     elif isinstance(card, RoomCard) or (hasattr(card, 'is_room') and card.is_room):
         return 'rooms'
     else:
-        # Try to infer from string representation
-        card_str = str(card).lower()
-        from cluedo_game.cards import get_rooms, get_weapons
+        # Try to infer from the name (Room objects, plain strings)
+        card_str = str(getattr(card, 'name', card)).lower()
         
-        if any(room.lower() in card_str for room in get_rooms()):
+        if card_str in _ROOM_NAMES_LC:
             return 'rooms'
-        elif any(weapon.name.lower() in card_str for weapon in get_weapons()):
+        elif card_str in _WEAPON_NAMES_LC:
             return 'weapons'
         else:
             return 'suspects'  # Default to suspect if unknown
@@ -97,6 +127,21 @@ def format_suggestion(suggestion: Dict[str, Any]) -> str:
     """
     Format a suggestion as a human-readable string.
     
+    Args:
+        suggestion: Dictionary with 'character' and 'weapon' cards and a
+            'room' given as a Room object or room name
+        
+    Returns:
+        Formatted string
+    """
+    room = suggestion['room']
+    return (f"{suggestion['character'].name} with the {suggestion['weapon'].name} "
+            f"in the {getattr(room, 'name', room)}")
+
+def format_suggestion_loose(suggestion: Dict[str, Any]) -> str:
+    """
+    Format a suggestion whose cards may be given as plain strings.
+    
     Args:
         suggestion: Dictionary with 'character', 'weapon', 'room' keys
         
@@ -1,6 +1,7 @@
 """
 Card classes for Cluedo game: Suspect, Weapon, Room.
 """
+import sys
 
 # Mapping of character names to starting positions
 CHARACTER_STARTING_SPACES = {
@@ -14,52 +15,63 @@ CHARACTER_STARTING_SPACES = {
 
 class Card:
     """Base class for all cards in Cluedo."""
+    # Cards are not renamed once created, so the hash is computed up front
+    __slots__ = ("name", "_hash")
+
     def __init__(self, name):
-        self.name = name
+        # Names come from a small fixed vocabulary; interning them lets
+        # comparisons short-circuit on identity
+        self.name = sys.intern(name) if type(name) is str else name
+        self._hash = hash((self.name, type(self)))
 
     def __eq__(self, other):
-        return isinstance(other, Card) and self.name == other.name and type(self) == type(other)
+        return other.__class__ is self.__class__ and other.name == self.name
 
     def __hash__(self):
-        return hash((self.name, type(self)))
+        return self._hash
 
     def __repr__(self):
         return f"{self.__class__.__name__}(name={self.name})"
 
 class SuspectCard(Card):
+    __slots__ = ("position",)
+
     def __init__(self, name):
         super().__init__(name)
         # Set the starting position based on the character's name
         self.position = CHARACTER_STARTING_SPACES.get(name, None)
 
 class WeaponCard(Card):
-    pass
+    __slots__ = ()
 
 class RoomCard(Card):
-    pass
+    __slots__ = ()
 
-# List of classic Cluedo suspects
-SUSPECTS = [
+# Classic Cluedo suspects
+SUSPECTS = (
     SuspectCard("Miss Scarlett"),
     SuspectCard("Colonel Mustard"),
     SuspectCard("Mrs. White"),
     SuspectCard("Reverend Green"),
     SuspectCard("Mrs. Peacock"),
     SuspectCard("Professor Plum")
-]
+)
+
+# Suspect cards keyed by name, for constant-time lookup
+_SUSPECTS_BY_NAME = {suspect.name: suspect for suspect in SUSPECTS}
 
-# List of classic Cluedo weapons
-WEAPONS = [
+# Classic Cluedo weapons
+WEAPONS = (
     WeaponCard("Candlestick"),
     WeaponCard("Dagger"),
     WeaponCard("Lead Pipe"),
     WeaponCard("Revolver"),
     WeaponCard("Rope"),
     WeaponCard("Wrench")
-]
+)
 
-# List of classic Cluedo rooms
-ROOMS = [
+# Classic Cluedo rooms
+ROOMS = tuple(sys.intern(room) for room in (
     "Kitchen",
     "Ballroom",
     "Conservatory",
@@ -69,23 +81,20 @@ ROOMS = [
     "Hall",
     "Lounge",
     "Dining Room"
-]
+))
 
 def get_suspects():
-    """Return a list of all suspect card instances."""
+    """Return a tuple of all suspect card instances."""
     return SUSPECTS
 
 def get_weapons():
-    """Return a list of all weapon card instances."""
+    """Return a tuple of all weapon card instances."""
     return WEAPONS
 
 def get_rooms():
-    """Return a list of all room names."""
+    """Return a tuple of all room names."""
     return ROOMS
 
 def get_suspect_by_name(name):
     """Return a suspect card instance by name, or None if not found."""
-    for suspect in SUSPECTS:
-        if suspect.name == name:
-            return suspect
-    return None
+    return _SUSPECTS_BY_NAME.get(name)
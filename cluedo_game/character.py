@@ -2,13 +2,18 @@
 Character definitions for Cluedo game.
 Defines each character and their starting positions in the mansion.
 """
-import random
+import sys
+
+from cluedo_game.cards import CHARACTER_STARTING_SPACES
 
 class Character:
+    __slots__ = ("name", "position", "hand", "eliminated")
+
     def __init__(self, name, starting_position):
-        self.name = name
+        self.name = sys.intern(name) if type(name) is str else name
         self.position = starting_position
         self.hand = []  # List of cards dealt to this character
+        self.eliminated = False  # True once the character's player is out
 
     def add_card(self, card):
         self.hand.append(card)
@@ -17,7 +22,7 @@ class Character:
         return f"Character(name={self.name}, position={self.position}, hand={self.hand})"
 
 # List of classic Cluedo character names and their canonical starting spaces
-# CHARACTER_STARTING_SPACES is assigned to match the classic Cluedo board layout as in the provided image:
+# CHARACTER_STARTING_SPACES (defined in cluedo_game.cards) is assigned to match the classic Cluedo board layout as in the provided image:
 #
 #   [C3]   [C4]   [C5]
 #     |      |      |
@@ -32,28 +37,19 @@ class Character:
 #   Reverend Green: C4 (top middle, above Ballroom)
 #   Mrs. Peacock: C5 (top right, above Conservatory)
 #   Professor Plum: C6 (right middle, right of Study)
-CHARACTER_STARTING_SPACES = {
-    "Miss Scarlett": "C1",         # bottom left, left of Lounge
-    "Colonel Mustard": "C2",      # left middle, below Dining Room
-    "Mrs. White": "C3",           # top left, above Kitchen
-    "Reverend Green": "C4",       # top middle, above Ballroom
-    "Mrs. Peacock": "C5",         # top right, above Conservatory
-    "Professor Plum": "C6"         # right middle, right of Study
-}
-CHARACTER_NAMES = list(CHARACTER_STARTING_SPACES.keys())
+CHARACTER_NAMES = tuple(CHARACTER_STARTING_SPACES)
+
+# Canonical Character instances, built once; lookups share them
+_CHARACTERS = tuple(Character(name, CHARACTER_STARTING_SPACES[name]) for name in CHARACTER_NAMES)
+_CHARACTERS_BY_NAME = {character.name: character for character in _CHARACTERS}
 
 def get_characters(rooms=None):
     """
-    Return a list of Character instances, each with their canonical starting position (edge of board).
+    Return a tuple of Character instances, each with their canonical starting position (edge of board).
+    The instances are shared between calls and should be treated as read-only.
     """
-    return [Character(name, CHARACTER_STARTING_SPACES[name]) for name in CHARACTER_NAMES]
+    return _CHARACTERS
 
 def get_character_by_name(name):
     """Return a character instance by name, or None if not found."""
-    for character in get_characters():
-        try:
-            if character.name == name:
-                return character
-        except AttributeError:
-            continue
-    return None
+    return _CHARACTERS_BY_NAME.get(name)
@@ -4,10 +4,13 @@ Player actions for the Cluedo game.
 This module handles player actions like movement, suggestions, and accusations.
 """
 import random
-from typing import Dict, List, Optional, Any, Tuple
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Tuple
 
 from cluedo_game.player import Player
-from cluedo_game.cards import Card, SuspectCard, WeaponCard, RoomCard
+from cluedo_game.cards import Card
+from cluedo_game.solution import solution_key
+from cluedo_game.ids import card_id, card_mask
 
 class ActionHandler:
     """Handles all player actions in the game."""
@@ -20,6 +23,9 @@ class ActionHandler:
             game: Reference to the main game instance
         """
         self.game = game
+        # Player -> (hand, hand size, hand bitmask, card ID -> card); an entry
+        # is rebuilt when the player's hand is replaced or changes size
+        self._hand_index = {}
     
     def handle_movement(self, player: Player, steps: int) -> None:
         """
@@ -51,41 +57,15 @@ class ActionHandler:
             return
             
         # Human player chooses destination
-        self.game.output("\nAvailable destinations:")
-        for i, dest in enumerate(destinations, 1):
-            self.game.output(f"{i}. {dest}")
-            
-        while True:
-            choice = self.game.input("Choose destination (or press Enter to skip): ").strip()
-            if not choice:
-                return
-                
-            try:
-                idx = int(choice) - 1
-                if 0 <= idx < len(destinations):
-                    self._move_player(player, destinations[idx])
-                    return
-                self.game.output(f"Please enter a number between 1 and {len(destinations)}.")
-            except ValueError:
-                self.game.output("Please enter a valid number.")
+        dest = self._get_human_destination_choice(destinations)
+        if dest is not None:
+            self._move_player(player, dest)
     
     def _get_human_destination_choice(self, destinations: List[str]) -> Optional[str]:
         """Get destination choice from human player."""
-        self.game.output("\nAvailable destinations:")
-        for i, dest in enumerate(destinations, 1):
-            self.game.output(f"{i}. {dest}")
-        
-        while True:
-            choice = self.game.input("Choose destination (or press Enter to skip): ").strip()
-            if not choice:
-                return None
-            try:
-                idx = int(choice) - 1
-                if 0 <= idx < len(destinations):
-                    return destinations[idx]
-                self.game.output(f"Please enter a number between 1 and {len(destinations)}.")
-            except ValueError:
-                self.game.output("Please enter a valid number.")
+        idx = self.game._prompt_choice(destinations, "Choose destination (or press Enter to skip): ",
+                                       header="\nAvailable destinations:", allow_skip=True)
+        return None if idx is None else destinations[idx]
     
     def _get_ai_destination_choice(self, ai_player: Player, destinations: List[str]) -> Optional[str]:
         """
@@ -102,16 +82,15 @@ class ActionHandler:
             return None
             
         # Prefer rooms over corridors
-        rooms = [d for d in destinations if not str(d).startswith('C')]
+        is_corridor = self.game.mansion.is_corridor
+        rooms = [d for d in destinations if not is_corridor(d)]
         if rooms:
             # If we can reach a room, choose one at random
-            import random
             destination = random.choice(rooms)
             self.game.output(f"{ai_player.name} chooses to move to {destination}")
             return destination
             
         # Otherwise, choose a random corridor
-        import random
         destination = random.choice(destinations)
         self.game.output(f"{ai_player.name} moves to corridor {destination}")
         return destination
@@ -128,7 +107,8 @@ class ActionHandler:
         player.position = destination
         
         # Check if player passed through a door
-        if not str(old_pos).startswith('C') and str(destination).startswith('C'):
+        is_corridor = self.game.mansion.is_corridor
+        if not is_corridor(old_pos) and is_corridor(destination):
             self.game.last_door_passed[player.name] = old_pos
         
         self.game.output(f"{player.name} moved from {old_pos} to {destination}")
@@ -273,9 +253,7 @@ class ActionHandler:
     
     def _handle_accusation(self, player: Player, suspect: str, weapon: str, room: str) -> bool:
         """Handle a player making an accusation."""
-        is_correct = (suspect == self.game.solution.character.name and
-                     weapon == self.game.solution.weapon.name and
-                     room == self.game.solution.room.name)
+        is_correct = (suspect, weapon, room) == solution_key(self.game.solution)
         
         if is_correct:
             self.game.output(f"\n{player.name} correctly accused {suspect} with the {weapon} in the {room}!")
@@ -315,35 +293,40 @@ class ActionHandler:
             Tuple of (refuting_player, shown_card) or (None, None) if no refutation
         """
         players = self._get_players_after(suggesting_player)
+        suggested = card_mask((suspect, weapon, room))
         
         for player in players:
             # Check if player has any of the suggested cards
-            for card in player.hand:
-                if (isinstance(card, SuspectCard) and card.name == suspect) or \
-                   (isinstance(card, WeaponCard) and card.name == weapon) or \
-                   (isinstance(card, RoomCard) and card.name == room):
-                    return player, card
+            hand_mask, cards_by_id = self._indexed_hand(player)
+            hit = hand_mask & suggested
+            if hit:
+                # Show the matching card with the lowest ID
+                return player, cards_by_id[(hit & -hit).bit_length() - 1]
         
         return None, None
     
-    def _get_players_after(self, current_player: Player) -> List[Player]:
+    def _indexed_hand(self, player: Player) -> Tuple[int, Dict[int, Card]]:
+        """Return the bitmask of a player's hand and its cards keyed by card ID."""
+        hand = player.hand
+        entry = self._hand_index.get(player)
+        if entry is None or entry[0] is not hand or entry[1] != len(hand):
+            cards_by_id = {}
+            for card in hand:
+                i = card_id(card)
+                if i is not None:
+                    cards_by_id.setdefault(i, card)
+            entry = (hand, len(hand), card_mask(cards_by_id.values()), cards_by_id)
+            self._hand_index[player] = entry
+        return entry[2], entry[3]
+    
+    def _get_players_after(self, current_player: Player) -> Deque[Player]:
         """Get all players who come after the current player in turn order."""
-        all_players = self.game.game_loop._get_play_order()
-        current_idx = all_players.index(current_player)
-        return all_players[current_idx+1:] + all_players[:current_idx]
+        after = deque(self.game.game_loop._get_play_order())
+        after.rotate(-after.index(current_player))
+        after.popleft()
+        return after
     
     def _get_player_choice(self, prompt: str, options: List[str]) -> str:
         """Helper method to get a choice from the player."""
-        self.game.output(f"\n{prompt}s:")
-        for i, option in enumerate(options, 1):
-            self.game.output(f"{i}. {option}")
-        
-        while True:
-            choice = self.game.input(f"Choose {prompt.lower()}: ").strip()
-            try:
-                idx = int(choice) - 1
-                if 0 <= idx < len(options):
-                    return options[idx]
-                self.game.output(f"Please enter a number between 1 and {len(options)}.")
-            except ValueError:
-                self.game.output("Please enter a valid number.")
+        idx = self.game._prompt_choice(options, f"Choose {prompt.lower()}: ", header=f"\n{prompt}s:")
+        return options[idx]
@@ -5,12 +5,14 @@ This module handles AI player behavior and decision making.
 """
 import random
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, TYPE_CHECKING
 
-from cluedo_game.ai import NashAIPlayer
 from cluedo_game.player import Player
 from cluedo_game.cards import Card, SuspectCard, WeaponCard, RoomCard
 
+if TYPE_CHECKING:
+    from cluedo_game.ai import NashAIPlayer
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -25,8 +27,29 @@ class AIController:
             game: Reference to the main game instance
         """
         self.game = game
+        # Own generator with its choice method bound once, rather than going
+        # through the random module's shared instance on every decision
+        self._rand = random.Random()
+        self._choice = self._rand.choice
+        # Suspect and weapon names, with the lists they were built from
+        self._names_source = (None, None)
+        self._suspect_names: List[str] = []
+        self._weapon_names: List[str] = []
+    
+    def _card_names(self) -> Tuple[List[str], List[str]]:
+        """Return the suspect and weapon names, rebuilt only when the game's lists change."""
+        characters = self.game.player_manager.characters
+        weapons = self.game.weapons
+        source = self._names_source
+        if (source[0] is not characters or source[1] is not weapons or
+                len(self._suspect_names) != len(characters) or
+                len(self._weapon_names) != len(weapons)):
+            self._suspect_names = [s.name for s in characters]
+            self._weapon_names = [w.name for w in weapons]
+            self._names_source = (characters, weapons)
+        return self._suspect_names, self._weapon_names
     
-    def get_ai_move(self, ai_player: NashAIPlayer, steps: int) -> str:
+    def get_ai_move(self, ai_player: 'NashAIPlayer', steps: int) -> str:
         """
         Get the AI's chosen move.
         
@@ -46,20 +69,21 @@ class AIController:
             return current_pos  # Stay in place if no valid moves
         
         # Simple AI: prefer rooms over corridors
-        room_destinations = [d for d in destinations if not str(d).startswith('C')]
+        is_corridor = self.game.mansion.is_corridor
+        room_destinations = [d for d in destinations if not is_corridor(d)]
         
         if room_destinations:
             # Choose a random room
-            destination = random.choice(room_destinations)
+            destination = self._choice(room_destinations)
             logger.info(f"{ai_player.name} moving from {current_pos} to room {destination}")
             return destination
         else:
             # Choose a random corridor
-            destination = random.choice(destinations)
+            destination = self._choice(destinations)
             logger.info(f"{ai_player.name} moving from {current_pos} to corridor {destination}")
             return destination
     
-    def get_ai_suggestion(self, ai_player: NashAIPlayer) -> Tuple[str, str, str]:
+    def get_ai_suggestion(self, ai_player: 'NashAIPlayer') -> Tuple[str, str, str]:
         """
         Get the AI's suggestion.
         
@@ -70,15 +94,32 @@ class AIController:
             Tuple of (suspect, weapon, room)
         """
         # Simple AI: suggest a random combination
-        suspects = [s.name for s in self.game.player_manager.characters]
-        weapons = [w.name for w in self.game.weapons]
+        suspects, weapons = self._card_names()
         
         # The room is the current room
         room = str(ai_player.position)
         
-        return random.choice(suspects), random.choice(weapons), room
+        return self._choice(suspects), self._choice(weapons), room
+    
+    def get_ai_suggestion_batch(self, ai_player: 'NashAIPlayer', n: int) -> List[Tuple[str, str, str]]:
+        """
+        Get n suggestions at once, for simulated games.
+        
+        Args:
+            ai_player: The AI player making the suggestions
+            n: Number of suggestions to draw
+            
+        Returns:
+            List of (suspect, weapon, room) tuples
+        """
+        suspects, weapons = self._card_names()
+        room = str(ai_player.position)
+        
+        return [(suspect, weapon, room) for suspect, weapon in zip(
+            self._rand.choices(suspects, k=n), self._rand.choices(weapons, k=n)
+        )]
     
-    def get_ai_accusation(self, ai_player: NashAIPlayer) -> Optional[Tuple[str, str, str]]:
+    def get_ai_accusation(self, ai_player: 'NashAIPlayer') -> Optional[Tuple[str, str, str]]:
         """
         Get the AI's accusation, if any.
         
@@ -89,16 +130,15 @@ class AIController:
             Tuple of (suspect, weapon, room) if making an accusation, None otherwise
         """
         # Simple AI: randomly decide whether to make an accusation
-        if random.random() < 0.1:  # 10% chance to make an accusation
-            suspects = [s.name for s in self.game.player_manager.characters]
-            weapons = [w.name for w in self.game.weapons]
+        if self._rand.random() < 0.1:  # 10% chance to make an accusation
+            suspects, weapons = self._card_names()
             rooms = [r.name for r in self.game.mansion.rooms]
             
-            return random.choice(suspects), random.choice(weapons), random.choice(rooms)
+            return self._choice(suspects), self._choice(weapons), self._choice(rooms)
         
         return None
     
-    def update_ai_knowledge(self, ai_player: NashAIPlayer, 
+    def update_ai_knowledge(self, ai_player: 'NashAIPlayer', 
                            suggestion: Dict[str, Any], 
                            refuting_player: Optional[Player] = None, 
                            shown_card: Optional[Card] = None) -> None:
@@ -4,7 +4,10 @@ Core game module for Cluedo.
 This module contains the main game class and core game logic.
 """
 import logging
-from typing import List, Optional, Dict, Any, Tuple, Union, Callable
+import traceback
+
+import numpy as np
+from typing import List, Optional, Dict, Any, Tuple, Union, Callable, TYPE_CHECKING
 
 from cluedo_game.game.ui import GameUI
 from cluedo_game.game.actions import ActionHandler
@@ -14,14 +17,17 @@ from cluedo_game.game.player_management import PlayerManager
 from cluedo_game.mansion import Mansion
 from cluedo_game.player import Player
 from cluedo_game.cards import Card, SuspectCard, WeaponCard, RoomCard, get_weapons, get_rooms, get_suspects, CHARACTER_STARTING_SPACES
-from cluedo_game.solution import Solution, create_solution
+from cluedo_game.solution import Solution, create_solution, solution_key
 from cluedo_game.suggestion import Suggestion
 from cluedo_game.movement import Movement
 from cluedo_game.history import SuggestionHistory
-from cluedo_game.ai.nash_ai_player import NashAIPlayer
+from cluedo_game.ids import card_mask
+
+if TYPE_CHECKING:
+    from cluedo_game.ai.nash_ai_player import NashAIPlayer
 
 # Import game modules
-from .player_management import PlayerManager
+from .player_management import PlayerManager, _get_nash
 from .game_loop import GameLoop
 from .actions import ActionHandler
 from .ui import GameUI
@@ -42,6 +48,20 @@ logging.getLogger('cluedo_game.game.ai_controller').setLevel(logging.INFO)
 logging.getLogger('cluedo_game.movement').setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Board listing shown by CluedoGame.display_board; the board never changes
+_BOARD_LISTING = "\n".join([
+    "\nRooms:",
+    *(f"- {room} ({coord})" for room, coord in (
+        ('Kitchen', 'A1'), ('Ballroom', 'A3'), ('Conservatory', 'A5'),
+        ('Dining Room', 'C1'), ('Billiard Room', 'C3'), ('Library', 'C5'),
+        ('Lounge', 'E1'), ('Hall', 'E3'), ('Study', 'E5'))),
+    "\nCorridors:",
+    *(f"- {corridor} ({coord})" for corridor, coord in (
+        ('C1', 'E2'), ('C2', 'C2'), ('C3', 'A2'), ('C4', 'A4'), ('C5', 'B5'),
+        ('C6', 'F5'), ('C7', 'D2'), ('C8', 'B2'), ('C9', 'B3'), ('C10', 'B4'),
+        ('C11', 'C4'), ('C12', 'D4'))),
+])
+
 class CluedoGame:
     """Main game class for Cluedo."""
     
@@ -62,7 +82,7 @@ class CluedoGame:
         if hasattr(self, 'player_manager'):
             self.player_manager.characters = value
         
-    def __init__(self, input_func=input, output_func=print, with_ai=False):
+    def __init__(self, input_func=input, output_func=print, with_ai=False, verbose=True):
         """
         Initialize the Cluedo game.
         
@@ -70,11 +90,15 @@ class CluedoGame:
             input_func: Function to use for input (default: builtin input)
             output_func: Function to use for output (default: builtin print)
             with_ai: Whether to play with AI opponents (default: False)
+            verbose: Whether AI players narrate their turns (default: True)
         """
         self.input = input_func
         self.output = output_func
         self.with_ai = with_ai  # Default to False to match test expectations
+        self.verbose = verbose
         self.logger = logger
+        # Per-game PCG64 generator for dice, shuffles and the solution draw
+        self.rng = np.random.default_rng()
         
         # Initialize managers and components first
         self.mansion = Mansion()
@@ -83,9 +107,9 @@ class CluedoGame:
         self.player_manager = PlayerManager(self)  # Initialize player manager before accessing characters
         
         # Initialize game state
-        self.solution = create_solution()
+        self.solution = create_solution(self.rng)
         self.player: Optional[Player] = None
-        self.ai_players: List[NashAIPlayer] = []
+        self.ai_players: List['NashAIPlayer'] = []
         self.players = []  # List to hold all player objects
         self.suggestion_history = SuggestionHistory()
         self.last_door_passed = {}  # Track last door passed by each player
@@ -95,6 +119,11 @@ class CluedoGame:
         self.rooms = get_rooms()
         self.suspects = get_suspects()
         
+        # Names offered at the suggestion and accusation prompts, built once
+        self._suspect_names = [s.name for s in self.suspects]
+        self._weapon_names = [w.name for w in self.weapons]
+        self._room_names = [getattr(r, 'name', r) for r in self.rooms]
+        
         # Initialize remaining components
         self.action_handler = ActionHandler(self)
         self.win_condition_checker = WinConditionChecker(self)
@@ -130,19 +159,8 @@ class CluedoGame:
             if self._moved_this_turn:
                 actions.remove("Move")  # Remove Move option if already moved this turn
                 
-            self.output("\nWhat would you like to do?")
-            for i, action in enumerate(actions, 1):
-                self.output(f"{i}. {action}")
-            
             # Get player's choice
-            while True:
-                try:
-                    choice = int(self.input("Enter your choice: ").strip()) - 1
-                    if 0 <= choice < len(actions):
-                        break
-                    self.output(f"Please enter a number between 1 and {len(actions)}.")
-                except ValueError:
-                    self.output("Please enter a valid number.")
+            choice = self._prompt_choice(actions, "Enter your choice: ", "\nWhat would you like to do?")
             
             # Handle the chosen action
             if actions[choice] == "Move" and not self._moved_this_turn:
@@ -151,13 +169,13 @@ class CluedoGame:
                 self._moved_this_turn = True
                 
                 # If player is in a room and hasn't made a suggestion yet, they can make a suggestion
-                in_room = not str(self.player.position).startswith('C')
+                in_room = not self.mansion.is_corridor(self.player.position)
                 if in_room and not getattr(self, '_suggestion_made', False):
                     if self.suggestion_phase():
                         return True  # Game over
             
             elif actions[choice] == "Make Suggestion":
-                in_room = not str(self.player.position).startswith('C')
+                in_room = not self.mansion.is_corridor(self.player.position)
                 if in_room:
                     if self.suggestion_phase():
                         return True  # Game over
@@ -168,6 +186,8 @@ class CluedoGame:
             elif actions[choice] == "Make Accusation":
                 if self.prompt_accusation():
                     return True  # Game over
+                if getattr(self.player, 'eliminated', False):
+                    break  # A wrong accusation ends the player's turn
             
             elif actions[choice] == "View Suggestion History":
                 self.show_suggestion_history()
@@ -197,56 +217,35 @@ class CluedoGame:
             return
             
         # Group destinations by type (corridors and rooms)
-        corridors = [d for d in destinations if d.startswith('C')]
-        rooms = [d for d in destinations if not d.startswith('C')]
-        
-        # Display destinations in a more organized way
-        self.output("\nAvailable destinations:")
-        
-        # Display rooms first
-        if rooms:
-            self.output("\nRooms:")
-            for i, room in enumerate(rooms, 1):
-                self.output(f"{i}. {room}")
-        
-        # Then display corridors
-        if corridors:
-            self.output("\nCorridors:")
-            for i, corridor in enumerate(corridors, len(rooms) + 1):
-                self.output(f"{i}. {corridor}")
-                
-        # Create a combined list for selection
-        all_destinations = rooms + corridors
+        is_corridor = self.mansion.is_corridor
+        corridors = [d for d in destinations if is_corridor(d)]
+        rooms = [d for d in destinations if not is_corridor(d)]
+        
+        def show_destinations():
+            # Display destinations in a more organized way, as one message
+            lines = ["\nAvailable destinations:"]
+            
+            # Display rooms first
+            if rooms:
+                lines.append("\nRooms:")
+                lines.extend(f"{i}. {room}" for i, room in enumerate(rooms, 1))
+            
+            # Then display corridors
+            if corridors:
+                lines.append("\nCorridors:")
+                lines.extend(f"{i}. {corridor}" for i, corridor in enumerate(corridors, len(rooms) + 1))
+            self.output("\n".join(lines))
+        
+        def show_history():
+            self.show_suggestion_history()
+            input("\nPress Enter to continue...")
+            show_destinations()
+        
+        show_destinations()
             
         # Get player's choice
-        while True:
-            try:
-                choice_input = self.input("Enter your choice (or 'h' for history): ").strip().lower()
-                
-                # Check for history command
-                if choice_input == 'h':
-                    self.show_suggestion_history()
-                    input("\nPress Enter to continue...")
-                    
-                    # Redisplay destinations
-                    self.output("\nAvailable destinations:")
-                    if rooms:
-                        self.output("\nRooms:")
-                        for i, room in enumerate(rooms, 1):
-                            self.output(f"{i}. {room}")
-                    if corridors:
-                        self.output("\nCorridors:")
-                        for i, corridor in enumerate(corridors, len(rooms) + 1):
-                            self.output(f"{i}. {corridor}")
-                    continue
-                
-                # Process numeric choice
-                choice = int(choice_input) - 1
-                if 0 <= choice < len(destinations):
-                    break
-                self.output(f"Please enter a number between 1 and {len(destinations)}.")
-            except ValueError:
-                self.output("Please enter a valid number or 'h' for history.")
+        choice = self._prompt_choice(destinations, "Enter your choice (or 'h' for history): ",
+                                     on_history=show_history)
                 
         # Move player and return the new position
         new_pos = destinations[choice]
@@ -312,7 +311,6 @@ class CluedoGame:
                     return result
                 except Exception as e:
                     print(f"DEBUG: Error in make_suggestion: {e}")
-                    import traceback
                     traceback.print_exc()
                     return False
             else:
@@ -349,37 +347,14 @@ class CluedoGame:
         self._suggestion_made = True
         
         # Get all suspects and weapons for the player to choose from
-        suspects = [s.name for s in get_suspects()]
-        weapons = [w.name for w in get_weapons()]
+        suspects = self._suspect_names
+        weapons = self._weapon_names
         
         # Get player's choice of suspect and weapon
-        self.output("\nChoose a suspect to suggest:")
-        for i, suspect in enumerate(suspects, 1):
-            self.output(f"{i}. {suspect}")
-            
-        while True:
-            try:
-                choice = int(self.input("Enter the number of the suspect: ")) - 1
-                if 0 <= choice < len(suspects):
-                    suggested_suspect = suspects[choice]
-                    break
-                self.output("Invalid choice. Please try again.")
-            except ValueError:
-                self.output("Please enter a number.")
-                
-        self.output("\nChoose a weapon to suggest:")
-        for i, weapon in enumerate(weapons, 1):
-            self.output(f"{i}. {weapon}")
-            
-        while True:
-            try:
-                choice = int(self.input("Enter the number of the weapon: ")) - 1
-                if 0 <= choice < len(weapons):
-                    suggested_weapon = weapons[choice]
-                    break
-                self.output("Invalid choice. Please try again.")
-            except ValueError:
-                self.output("Please enter a number.")
+        suggested_suspect = suspects[self._prompt_choice(
+            suspects, "Enter the number of the suspect: ", "\nChoose a suspect to suggest:")]
+        suggested_weapon = weapons[self._prompt_choice(
+            weapons, "Enter the number of the weapon: ", "\nChoose a weapon to suggest:")]
         
         # The room is the current room the player is in
         suggested_room = current_room
@@ -395,21 +370,26 @@ class CluedoGame:
         
         # Check if any other players can refute the suggestion
         refuted = False
-        for player in self.players:
-            if player == self.player:
-                continue  # Skip the current player
-                
-            # Check if player has any of the suggested cards
-            refutation = None
-            for card in player.hand:
-                if (isinstance(card, SuspectCard) and card.name == suggested_suspect) or \
-                   (isinstance(card, WeaponCard) and card.name == suggested_weapon) or \
-                   (isinstance(card, RoomCard) and card.name == suggested_room):
-                    refutation = card
-                    break
+        suggested = card_mask((suggested_suspect, suggested_weapon, suggested_room))
+        indexed_hand = self.action_handler._indexed_hand
+        
+        # Ask the other players in turn order, starting after the current player
+        players = self.players
+        if self.player in players:
+            current_idx = players.index(self.player)
+            others = players[current_idx + 1:] + players[:current_idx]
+        else:
+            others = players
             
-            if refutation:
-                if isinstance(player, NashAIPlayer):
+        for player in others:
+            # Check if player has any of the suggested cards; the one with
+            # the lowest ID (suspect, then weapon, then room) is shown
+            hand_mask, cards_by_id = indexed_hand(player)
+            hit = hand_mask & suggested
+            
+            if hit:
+                refutation = cards_by_id[(hit & -hit).bit_length() - 1]
+                if isinstance(player, _get_nash()):
                     self.output(f"{player.character.name} shows you a card.")
                 else:
                     self.output(f"{player.character.name} shows you: {refutation.name}")
@@ -447,49 +427,17 @@ class CluedoGame:
         self.output("You are about to make an accusation. Be careful - if you're wrong, you're out of the game!")
         
         # Get list of suspects, weapons, and rooms
-        suspects = [s.name for s in get_suspects()]
-        weapons = [w.name for w in get_weapons()]
-        rooms = [r.name for r in get_rooms()]
+        suspects = self._suspect_names
+        weapons = self._weapon_names
+        rooms = self._room_names
         
         # Let player select each component of the accusation
-        self.output("\nSelect the suspect you think did it:")
-        for i, suspect in enumerate(suspects, 1):
-            self.output(f"{i}. {suspect}")
-            
-        while True:
-            try:
-                suspect_choice = int(self.input("Enter suspect number: ")) - 1
-                if 0 <= suspect_choice < len(suspects):
-                    break
-                self.output(f"Please enter a number between 1 and {len(suspects)}")
-            except ValueError:
-                self.output("Please enter a valid number.")
-        
-        self.output("\nSelect the weapon you think was used:")
-        for i, weapon in enumerate(weapons, 1):
-            self.output(f"{i}. {weapon}")
-            
-        while True:
-            try:
-                weapon_choice = int(self.input("Enter weapon number: ")) - 1
-                if 0 <= weapon_choice < len(weapons):
-                    break
-                self.output(f"Please enter a number between 1 and {len(weapons)}")
-            except ValueError:
-                self.output("Please enter a valid number.")
-        
-        self.output("\nSelect the room where it happened:")
-        for i, room in enumerate(rooms, 1):
-            self.output(f"{i}. {room}")
-            
-        while True:
-            try:
-                room_choice = int(self.input("Enter room number: ")) - 1
-                if 0 <= room_choice < len(rooms):
-                    break
-                self.output(f"Please enter a number between 1 and {len(rooms)}")
-            except ValueError:
-                self.output("Please enter a valid number.")
+        suspect_choice = self._prompt_choice(
+            suspects, "Enter suspect number: ", "\nSelect the suspect you think did it:")
+        weapon_choice = self._prompt_choice(
+            weapons, "Enter weapon number: ", "\nSelect the weapon you think was used:")
+        room_choice = self._prompt_choice(
+            rooms, "Enter room number: ", "\nSelect the room where it happened:")
         
         # Confirm the accusation
         suspect = suspects[suspect_choice]
@@ -506,6 +454,44 @@ class CluedoGame:
             self.output("Accusation cancelled.")
             return False
     
+    def _prompt_choice(self, options: List[Any], prompt: str, header: Optional[str] = None,
+                       on_history: Optional[Callable[[], None]] = None,
+                       allow_skip: bool = False) -> Optional[int]:
+        """
+        Ask the player to pick one of a numbered list of options.
+        
+        Args:
+            options: The options to choose from
+            prompt: Prompt shown when asking for a number
+            header: If given, shown followed by the numbered options; otherwise
+                    the caller has already listed them
+            on_history: If given, called when the player enters 'h'
+            allow_skip: If True, an empty answer skips the choice
+            
+        Returns:
+            Optional[int]: Index of the chosen option, or None if skipped
+        """
+        if header is not None:
+            self.output("\n".join([header, *(f"{i}. {option}" for i, option in enumerate(options, 1))]))
+        
+        count = len(options)
+        while True:
+            raw = self.input(prompt).strip()
+            if allow_skip and not raw:
+                return None
+            # Check the digits up front rather than catching int()'s ValueError
+            if raw.isdecimal():
+                choice = int(raw) - 1
+                if 0 <= choice < count:
+                    return choice
+                self.output(f"Please enter a number between 1 and {count}.")
+            elif on_history is not None and raw.lower() == 'h':
+                on_history()
+            elif on_history is not None:
+                self.output("Please enter a valid number or 'h' for history.")
+            else:
+                self.output("Please enter a valid number.")
+    
     def is_ai_mode(self) -> bool:
         """Check if the game is in AI mode."""
         return self.with_ai
@@ -526,53 +512,37 @@ class CluedoGame:
         if not players:
             return
             
+        # Names of the solution cards, which are never dealt
+        solution_character, solution_weapon, solution_room = solution_key(self.solution)
+        
         if all_cards is None:
-            # Build the deck (all cards except those in the solution)
-            deck = []
-            
-            # Add suspect cards (excluding solution character)
-            for suspect in get_suspects():
-                if suspect.name != self.solution.character.name:
-                    deck.append(suspect)
-                    
-            # Add weapon cards (excluding solution weapon)
-            for weapon in get_weapons():
-                if weapon.name != self.solution.weapon.name:
-                    deck.append(weapon)
-                    
-            # Add room cards (excluding solution room)
-            for room in get_rooms():
-                if room != self.solution.room:
-                    deck.append(room)
+            # Build the deck (all cards except those in the solution) from
+            # the card tuples built once at import
+            deck = [suspect for suspect in get_suspects() if suspect.name != solution_character]
+            deck += [weapon for weapon in get_weapons() if weapon.name != solution_weapon]
+            deck += [room for room in get_rooms() if room != solution_room]
         else:
-            # Use the provided cards, but make a copy to avoid modifying the original
-            deck = list(all_cards)
-            
-            # Remove solution cards from the deck
-            deck = [card for card in deck 
-                   if not (isinstance(card, SuspectCard) and card.name == getattr(self.solution.character, 'name', self.solution.character)) and
-                      not (isinstance(card, WeaponCard) and card.name == getattr(self.solution.weapon, 'name', self.solution.weapon)) and
-                      not (isinstance(card, RoomCard) and card.name == getattr(self.solution.room, 'name', str(self.solution.room)))]
+            # Remove solution cards from a copy of the provided cards
+            deck = [card for card in all_cards
+                   if not (isinstance(card, SuspectCard) and card.name == solution_character) and
+                      not (isinstance(card, WeaponCard) and card.name == solution_weapon) and
+                      not (isinstance(card, RoomCard) and card.name == solution_room)]
         
         # Shuffle the deck
-        import random
-        random.shuffle(deck)
+        self.rng.shuffle(deck)
         
         # Log the number of cards to deal and the number of players
         self.logger.debug(f"Dealing {len(deck)} cards to {len(players)} players")
         
-        # Deal cards to players in a round-robin fashion
-        for i, card in enumerate(deck):
-            player = players[i % len(players)]
+        # Deal cards to players in a round-robin fashion: player i takes
+        # every n-th card of the deck starting from card i
+        num_players = len(players)
+        for i, player in enumerate(players):
             # Ensure the player has a hand attribute
             if not hasattr(player, 'hand'):
                 player.hand = []
-            # Add the card to the player's hand
-            player.hand.append(card)
-            # For Character objects, we also need to ensure the hand is accessible
-            if hasattr(player, 'character') and not hasattr(player.character, 'hand'):
-                player.character.hand = player.hand
-            self.logger.debug(f"Dealt {card} to {player.name} (hand size: {len(player.hand)})")
+            # Add the player's share of the deck to their hand
+            player.hand.extend(deck[i::num_players])
         
         # Log the final hand sizes for each player
         self.logger.debug("Finished dealing cards. Final hand sizes:")
@@ -585,11 +555,17 @@ class CluedoGame:
         Returns:
             bool: True if the game has been won, False otherwise
         """
-        # Check if only one player remains
-        active_players = [p for p in self.get_all_players() if not getattr(p, 'eliminated', False)]
-        if len(active_players) == 1:
-            self.winner = active_players[0].name
-            return True
+        # Check if only one player remains, stopping at the second active one
+        survivor = None
+        for p in self.get_all_players():
+            if not p.eliminated:
+                if survivor is not None:
+                    break
+                survivor = p
+        else:
+            if survivor is not None:
+                self.winner = survivor.name
+                return True
             
         # Check if maximum turns reached
         if hasattr(self, 'turn_counter') and self.turn_counter >= getattr(self, 'max_turns', 50):
@@ -616,8 +592,8 @@ class CluedoGame:
             return
             
         # Get suspect and weapon choices
-        suspects = [s.name for s in get_suspects()]
-        weapons = [w.name for w in get_weapons()]
+        suspects = self._suspect_names
+        weapons = self._weapon_names
         
         suspect = self.ui.get_player_choice(
             "Select a suspect",
@@ -637,6 +613,25 @@ class CluedoGame:
             room=current_room.name
         )
         
+    def handle_refutation(self, suspect: Any, weapon: Any, room: Any,
+                          suggesting_player: Any) -> Tuple[Optional[str], Optional[Card]]:
+        """
+        Find the first player after the suggester who can refute a suggestion.
+        
+        Args:
+            suspect: The suggested suspect (card or name)
+            weapon: The suggested weapon (card or name)
+            room: The suggested room (Room, card or name)
+            suggesting_player: The player making the suggestion
+            
+        Returns:
+            Tuple of (refuting player's name, shown card), or (None, None) if
+            no one can refute
+        """
+        refuting_player, shown_card = self.action_handler._get_refutation(
+            suggesting_player, *(getattr(card, 'name', card) for card in (suspect, weapon, room)))
+        return (refuting_player.name if refuting_player else None), shown_card
+        
     def make_accusation(self, player: Any, suspect: str, weapon: str, room: str) -> bool:
         """Handle a player making an accusation.
         
@@ -664,16 +659,8 @@ class CluedoGame:
         else:
             room_name = room  # Assume it's already a string
             
-        # Get solution room name if it's an object with name attribute
-        solution_room = self.solution.room
-        solution_room_name = solution_room.name if hasattr(solution_room, 'name') else solution_room
-        
         # Compare with solution
-        is_correct = (
-            self.solution.character.name == suspect_name and
-            self.solution.weapon.name == weapon_name and
-            solution_room_name == room_name
-        )
+        is_correct = (suspect_name, weapon_name, room_name) == solution_key(self.solution)
         
         # Show the accusation result
         self.ui.show_accusation(
@@ -703,57 +690,81 @@ class CluedoGame:
         if not hasattr(self, 'turn_counter'):
             self.turn_counter = 0
             
-        while self.turn_counter < max_turns:
-            current_player = play_order[current_idx]
+        # Players still in the game, rotated so the next to move is first
+        active = self.game_loop._active_players(play_order, current_idx)
+        
+        # Resolve the AI turn handler once rather than probing for it every turn
+        process_ai_turn = getattr(self.game_loop, 'process_ai_turn', None)
             
-            # Skip eliminated players
-            if getattr(current_player, 'eliminated', False):
-                current_idx = (current_idx + 1) % len(play_order)
-                continue
+        while self.turn_counter < max_turns:
+            if not active:
+                self.ui.show_game_over("Game over - no active players left")
+                return
+            current_player = active[0]
+            active.rotate(-1)
                 
             # Play the turn
             self.ui.show_player_turn(current_player.name)
             
             if current_player == self.player:
                 # Human player's turn
-                if hasattr(self, 'process_human_turn'):
-                    self.process_human_turn(current_player)
+                game_over = self.process_human_turn()
                     
                 # Handle suggestion phase for human player
-                self.suggestion_phase()
+                if not game_over:
+                    self.suggestion_phase()
             else:
                 # AI player's turn
-                if hasattr(self, 'game_loop') and hasattr(self.game_loop, 'process_ai_turn'):
-                    self.game_loop.process_ai_turn(current_player)
+                game_over = process_ai_turn(current_player) if process_ai_turn is not None else False
                 
-            # Check for win condition
-            if self.check_win():
+            # The turn reports a correct accusation itself
+            if game_over:
                 self.ui.show_game_over(getattr(self, 'winner', None))
                 return
                 
+            # A wrong accusation eliminates the player; drop them from the
+            # rotation, and end the game if only one player is left standing.
+            # No other turn can change who is still playing.
+            if getattr(current_player, 'eliminated', False):
+                active.pop()
+                if len(active) == 1:
+                    self.winner = active[0].name
+                    self.ui.show_game_over(self.winner)
+                    return
+                
             # Move to next player
-            current_idx = (current_idx + 1) % len(play_order)
             self.turn_counter += 1
             
         # If we get here, we've reached max turns without a winner
         self.ui.show_game_over("Game over - maximum turns reached")
         
-    def get_all_players(self) -> List[Union[Player, NashAIPlayer]]:
+    def get_all_players(self) -> Tuple[Union[Player, 'NashAIPlayer'], ...]:
         """
         Get all players in the game, including AI players if in AI mode.
         
+        The sequence is built once and reused until the human player, the
+        character list or the game mode changes.
+        
         Returns:
-            List of all Player and NashAIPlayer objects in the game with human player first
+            Tuple of all Player and NashAIPlayer objects in the game with human player first
         """
-        if not hasattr(self, 'player') or self.player is None:
-            return self.characters.copy()
-            
-        if self.is_ai_mode():
-            # In AI mode, return human player first, then AI players
-            return [self.player] + [p for p in self.characters if p != self.player]
-            
-        # In non-AI mode, just return all characters
-        return self.characters.copy()
+        player, characters = getattr(self, 'player', None), self.characters
+        source = getattr(self, '_all_players_source', None)
+        if (source is None or source[0] is not player or source[1] is not characters
+                or source[2] != len(characters) or source[3] != self.with_ai):
+            self._rebuild_roster()
+        return self._all_players_cached
+    
+    def _rebuild_roster(self) -> None:
+        """Rebuild the cached sequence returned by get_all_players."""
+        player, characters = getattr(self, 'player', None), self.characters
+        if player is not None and self.is_ai_mode():
+            # In AI mode, human player first, then the other characters
+            self._all_players_cached = (player, *(p for p in characters if p != player))
+        else:
+            # Otherwise, just all characters
+            self._all_players_cached = tuple(characters)
+        self._all_players_source = (player, characters, len(characters), self.with_ai)
     
     def play(self) -> bool:
         """
@@ -788,38 +799,8 @@ class CluedoGame:
             self.output("\nBoard display not available.")
             return
             
-        # Get all rooms and corridors with their chess coordinates
-        rooms = {}
-        corridors = {}
-        
-        # Define room positions and their chess coordinates
-        room_data = {
-            'Kitchen': 'A1',
-            'Ballroom': 'A3',
-            'Conservatory': 'A5',
-            'Dining Room': 'C1',
-            'Billiard Room': 'C3',
-            'Library': 'C5',
-            'Lounge': 'E1',
-            'Hall': 'E3',
-            'Study': 'E5'
-        }
-        
-        # Define corridor positions and their chess coordinates
-        corridor_data = {
-            'C1': 'E2', 'C2': 'C2', 'C3': 'A2', 'C4': 'A4', 'C5': 'B5',
-            'C6': 'F5', 'C7': 'D2', 'C8': 'B2', 'C9': 'B3', 'C10': 'B4',
-            'C11': 'C4', 'C12': 'D4'
-        }
-        
-        # Output the board sections
-        self.output("\nRooms:")
-        for room_name, coord in room_data.items():
-            self.output(f"- {room_name} ({coord})")
-            
-        self.output("\nCorridors:")
-        for corridor, coord in corridor_data.items():
-            self.output(f"- {corridor} ({coord})")
+        # Output the board sections as one message
+        self.output(_BOARD_LISTING)
             
         # Show player locations
         self.print_player_locations()
@@ -3,12 +3,15 @@ Game loop and turn management for the Cluedo game.
 
 This module handles the main game loop and turn management.
 """
-import random
-from typing import List, Optional, Any, Dict, Tuple, Union
+from collections import deque
+from typing import Deque, List, Optional, Any, Dict, Tuple, Union
 
 from cluedo_game.player import Player
-from cluedo_game.ai import NashAIPlayer
 from cluedo_game.cards import Card, SuspectCard, WeaponCard, RoomCard
+from .player_management import _get_nash
+
+# Number of 2d6 rolls drawn from the game's generator at a time
+_DICE_BATCH = 256
 
 class GameLoop:
     """Manages the main game loop and turn order."""
@@ -22,6 +25,9 @@ class GameLoop:
         """
         self.game = game
         self.turn_counter = 0
+        # Rolls drawn ahead from the game's generator, and that generator
+        self._dice = []
+        self._dice_rng = None
     
     def play(self, max_turns: Optional[int] = None) -> bool:
         """
@@ -44,25 +50,29 @@ class GameLoop:
         
         # Main game loop
         max_iterations = max_turns if max_turns is not None else 100
-        current_idx = 0
+        
+        # Players still in the game, rotated so the next to move is first
+        active = self._active_players(play_order)
         
         for _ in range(max_iterations):
             self.turn_counter += 1
             
             # Get current player
-            current_player = self._get_next_player(play_order, current_idx)
-            if current_player is None:
+            if not active:
                 self.game.ui.show_message("No active players left! Game over.")
                 return False
-                
-            # Update current index for next turn
-            current_idx = (play_order.index(current_player) + 1) % len(play_order)
+            current_player = active[0]
+            active.rotate(-1)
             
             # Take turn
             game_over = self._handle_player_turn(current_player)
             if game_over:
                 return True
                 
+            # A wrong accusation eliminates the player; drop them from the rotation
+            if getattr(current_player, 'eliminated', False):
+                active.pop()
+                
             # Check for win condition after each turn
             winner = self.game.win_condition_checker.check_win_condition()
             if winner:
@@ -83,23 +93,20 @@ class GameLoop:
             return [self.game.player] + self.game.ai_players
         return self.game.characters
     
-    def _get_next_player(self, play_order: List[Player], start_idx: int) -> Optional[Player]:
+    def _active_players(self, play_order: List[Player], start_idx: int = 0) -> Deque[Player]:
         """
-        Get the next active player in the play order.
+        Get the players not yet eliminated, in turn order from start_idx.
         
         Args:
             play_order: List of players in turn order
-            start_idx: Index to start searching from
+            start_idx: Index of the player who moves first
             
         Returns:
-            The next active player, or None if no active players
+            The active players, starting from start_idx and wrapping around
         """
-        for i in range(len(play_order)):
-            idx = (start_idx + i) % len(play_order)
-            player = play_order[idx]
-            if not hasattr(player, 'eliminated') or not player.eliminated:
-                return player
-        return None
+        rotated = deque(play_order)
+        rotated.rotate(-start_idx)
+        return deque(player for player in rotated if not getattr(player, 'eliminated', False))
     
     def _handle_player_turn(self, player: Player) -> bool:
         """
@@ -125,6 +132,10 @@ class GameLoop:
         # Handle player movement
         self.game.action_handler.handle_movement(player, dice_roll)
         
+        # Nash AI players suggest and accuse from their own beliefs
+        if not player.is_human and isinstance(player, _get_nash()):
+            return player.finish_turn(self.game)
+        
         # Handle suggestions/accusations if in a room
         if self._should_make_suggestion(player):
             # Only return True if handle_suggestion returns True (game over)
@@ -137,8 +148,12 @@ class GameLoop:
     
     def _roll_dice(self) -> int:
         """Roll the dice for movement."""
-        import random
-        return random.randint(1, 6) + random.randint(1, 6)  # 2d6
+        rng = self.game.rng
+        if not self._dice or self._dice_rng is not rng:
+            # Draw a batch of 2d6 rolls in one generator call
+            self._dice = rng.integers(1, 7, size=(_DICE_BATCH, 2)).sum(axis=1).tolist()
+            self._dice_rng = rng
+        return self._dice.pop()
     
     def _should_make_suggestion(self, player: Player) -> bool:
         """
@@ -146,7 +161,7 @@ class GameLoop:
         
         Players can only make suggestions when in a room (not in a corridor)
         """
-        return not str(player.position).startswith('C')
+        return not self.game.mansion.is_corridor(player.position)
     
     def get_player_by_name(self, name: str) -> Optional[Player]:
         """
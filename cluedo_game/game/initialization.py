@@ -3,16 +3,38 @@ Game initialization for the Cluedo game.
 
 This module handles game setup and configuration.
 """
+import functools
 import logging
 import logging.config
 from typing import Callable, Dict, Any, Optional
 
+import numpy as np
+
 from cluedo_game.mansion import Mansion
 from cluedo_game.history import SuggestionHistory
 from cluedo_game.solution import Solution
 from cluedo_game.player import Player
 from cluedo_game.movement import Movement
 
+@functools.lru_cache(maxsize=1)
+def _init_logger() -> logging.Logger:
+    """
+    Configure logging from logger.conf and return the game logger.
+    
+    The configuration is read once per process; later calls return the
+    same logger without re-parsing the file or rebuilding its handlers.
+    """
+    try:
+        logging.config.fileConfig('logger.conf')
+        logger = logging.getLogger('cluedoGame')
+    except Exception as e:
+        logging.basicConfig(level=logging.INFO)
+        logger = logging.getLogger('cluedoGame')
+        logger.warning(
+            f"Failed to load logger.conf, using basic configuration: {e}"
+        )
+    return logger
+
 class GameInitializer:
     """Handles game initialization and setup."""
     
@@ -29,6 +51,7 @@ class GameInitializer:
         self.input = input_func
         self.output = output_func
         self.with_ai = with_ai
+        self.rng = np.random.default_rng()
         
         # Initialize components that will be set up later
         self.mansion: Optional[Mansion] = None
@@ -53,7 +76,7 @@ class GameInitializer:
         self.mansion = Mansion()
         self.movement = Movement(self.mansion)
         self.suggestion_history = SuggestionHistory()
-        self.solution = Solution.random_solution()
+        self.solution = Solution.random_solution(self.rng)
         
         # Set up players
         self._setup_players()
@@ -75,15 +98,7 @@ class GameInitializer:
     
     def _setup_logging(self) -> None:
         """Set up logging configuration."""
-        try:
-            logging.config.fileConfig('logger.conf')
-            self.logger = logging.getLogger('cluedoGame')
-        except Exception as e:
-            logging.basicConfig(level=logging.INFO)
-            self.logger = logging.getLogger('cluedoGame')
-            self.logger.warning(
-                f"Failed to load logger.conf, using basic configuration: {e}"
-            )
+        self.logger = _init_logger()
     
     def _setup_players(self) -> None:
         """Set up the players for the game."""
@@ -11,8 +11,25 @@ from cluedo_game.cards import (
     SuspectCard, WeaponCard, RoomCard, Card,
     CHARACTER_STARTING_SPACES
 )
-from cluedo_game.player import Player
-from cluedo_game.ai import NashAIPlayer
+from cluedo_game.solution import solution_key
+from cluedo_game.player import Player, PlayerRoster
+
+# The AI package is imported on first use by _get_nash, so games and tests
+# without AI players never load it
+NashAIPlayer = None
+
+def _get_nash():
+    """Return the NashAIPlayer class, importing the AI package on first use."""
+    global NashAIPlayer
+    if NashAIPlayer is None:
+        from cluedo_game.ai import NashAIPlayer as nash_ai_player
+        NashAIPlayer = nash_ai_player
+    return NashAIPlayer
+
+# Every card in the game, built once; cards are immutable so each deal reuses them
+_ALL_SUSPECT_CARDS = tuple(SuspectCard(suspect.name) for suspect in get_suspects())
+_ALL_WEAPON_CARDS = tuple(WeaponCard(weapon.name) for weapon in get_weapons())
+_ALL_ROOM_CARDS = tuple(RoomCard(room) for room in get_rooms())
 
 class PlayerManager:
     """Manages players, characters, and card distribution."""
@@ -27,7 +44,10 @@ class PlayerManager:
         self.game = game
         self._characters: List[Player] = []
         self.player: Optional[Player] = None
-        self.ai_players: List[NashAIPlayer] = []
+        self.ai_players: List['NashAIPlayer'] = []
+        # Roster of the seated players and the (player, ai_players, count) it was built from
+        self._roster: Optional[PlayerRoster] = None
+        self._roster_source = None
         
         # Initialize characters from suspect cards
         self._initialize_characters()
@@ -93,22 +113,15 @@ class PlayerManager:
         if not self.characters:
             self._initialize_characters()
             
-        self.game.ui.show_message("Select your character:")
+        # Show the whole menu in one message
+        lines = ["Select your character:"]
         for idx, player in enumerate(self.characters):
             chess_coord = self.game.mansion.get_chess_coordinate(player.position)
             pos_str = player.position  # Just use the position code directly
-            self.game.ui.show_message(f"  {idx + 1}. {player.name} (starts in {pos_str} [{chess_coord}])")
+            lines.append(f"  {idx + 1}. {player.name} (starts in {pos_str} [{chess_coord}])")
+        self.game.ui.show_message("\n".join(lines))
             
-        while True:
-            inp = self.game.input("Enter number: ").strip()
-            try:
-                choice = int(inp)
-                if 1 <= choice <= len(self.characters):
-                    self._process_character_selection(choice - 1)
-                    break
-                self.game.ui.show_message("Invalid selection.")
-            except ValueError:
-                self.game.ui.show_message("Please enter a valid number.")
+        self._process_character_selection(self.game._prompt_choice(self.characters, "Enter number: "))
     
     def _process_character_selection(self, selected_idx: int) -> None:
         """Process the selected character and set up AI players if needed."""
@@ -135,7 +148,7 @@ class PlayerManager:
         self.ai_players = []
         for i, character in enumerate(self.characters):
             if i != selected_idx:  # All characters except the player's
-                ai_player = NashAIPlayer(character.character)
+                ai_player = _get_nash()(character.character)
                 ai_player.position = character.position  # Preserve position
                 ai_player.is_human = False
                 self.ai_players.append(ai_player)
@@ -153,7 +166,7 @@ class PlayerManager:
         self.ai_players = []
         for idx in selected_indices:
             character = self.characters[idx]
-            ai_player = NashAIPlayer(character.character)
+            ai_player = _get_nash()(character.character)
             ai_player.position = character.position
             ai_player.is_human = False
             self.ai_players.append(ai_player)
@@ -169,15 +182,14 @@ class PlayerManager:
         This method follows the logic from the original game.py where solution cards
         are filtered out before dealing to ensure no player gets a solution card.
         """
-        # Get all cards in the game
-        all_cards = self._get_all_cards()
+        # Names of the solution cards, which are never dealt
+        sol_suspect, sol_weapon, sol_room = solution_key(self.game.solution)
         
-        # Get the solution cards to filter them out
-        solution_cards = self._get_solution_cards()
-        
-        # Remove solution cards from the deck
-        deck = [card for card in all_cards if not self._is_card_in_solution(card, solution_cards)]
-        random.shuffle(deck)
+        # Build the deck from the prebuilt cards, leaving out the solution
+        deck = [card for card in _ALL_SUSPECT_CARDS if card.name != sol_suspect]
+        deck += [card for card in _ALL_WEAPON_CARDS if card.name != sol_weapon]
+        deck += [card for card in _ALL_ROOM_CARDS if card.name != sol_room]
+        self.game.rng.shuffle(deck)
         
         # Get all players (human + AI)
         players = self._get_all_active_players()
@@ -185,21 +197,15 @@ class PlayerManager:
             self.game.ui.show_message("No players to deal cards to!")
             return
         
-        # Distribute cards as evenly as possible
-        num_cards = len(deck)
+        # Deal cards round-robin: player i takes every n-th card of the deck
+        # starting from card i, so hand sizes differ by at most one
         num_players = len(players)
-        
-        # Calculate cards per player and remainder
-        cards_per_player = num_cards // num_players
-        remainder = num_cards % num_players
-        
-        # Deal cards to each player
-        start = 0
         for i, player in enumerate(players):
-            # Give an extra card to the first 'remainder' players
-            end = start + cards_per_player + (1 if i < remainder else 0)
-            player.hand = deck[start:end]
-            start = end
+            player.hand = deck[i::num_players]
+            
+            # AI players start out knowing their own cards
+            if not player.is_human and isinstance(player, _get_nash()):
+                player.learn_own_hand()
             
             # Log the dealt cards for debugging
             if hasattr(self.game, 'logger'):
@@ -208,62 +214,53 @@ class PlayerManager:
     
     def _get_all_cards(self) -> List[Card]:
         """Get all cards in the game (suspects, weapons, rooms)."""
-        cards = []
-        
-        # Add suspect cards
-        cards.extend([SuspectCard(suspect.name) for suspect in get_suspects()])
-        
-        # Add weapon cards
-        cards.extend([WeaponCard(weapon.name) for weapon in get_weapons()])
-        
-        # Add room cards
-        cards.extend([RoomCard(room) for room in get_rooms()])
-        
-        return cards
+        return [*_ALL_SUSPECT_CARDS, *_ALL_WEAPON_CARDS, *_ALL_ROOM_CARDS]
     
-    def _get_solution_cards(self) -> List[Card]:
-        """Get the solution cards as a list of Card objects."""
-        return [
-            self.game.solution.character,
-            self.game.solution.weapon,
-            self.game.solution.room
-        ]
+    def _get_solution_cards(self) -> Set[Card]:
+        """
+        Get the solution cards as a set of Card objects.
+        
+        Cards compare by type and name, so membership in the set tells whether
+        a card is part of the solution.
+        """
+        character, weapon, room = solution_key(self.game.solution)
+        return {SuspectCard(character), WeaponCard(weapon), RoomCard(room)}
     
-    def _is_card_in_solution(self, card: Card, solution_cards: List[Card]) -> bool:
+    def _is_card_in_solution(self, card: Card, solution_cards: Set[Card]) -> bool:
         """
         Check if a card is part of the solution.
         
         Args:
             card: The card to check
-            solution_cards: List of cards in the solution
+            solution_cards: Set of cards in the solution
             
         Returns:
             bool: True if the card is in the solution, False otherwise
         """
-        for solution_card in solution_cards:
-            # Compare both name and type to ensure it's the exact card
-            if (card.name == solution_card.name and 
-                isinstance(card, type(solution_card))):
-                return True
-        return False
+        return card in solution_cards
     
-    def _get_all_active_players(self) -> List[Union[Player, NashAIPlayer]]:
+    def _get_all_active_players(self) -> List[Union[Player, 'NashAIPlayer']]:
         """
         Get all active (non-eliminated) players.
         
         Returns:
             List of active Player and NashAIPlayer objects
         """
-        players = []
-        
-        # Add human player if exists and not eliminated
-        if self.player is not None and not getattr(self.player, 'eliminated', False):
-            players.append(self.player)
-        
-        # Add AI players that are not eliminated
-        for ai_player in self.ai_players:
-            if not getattr(ai_player, 'eliminated', False):
-                players.append(ai_player)
+        roster = self._seated_roster()
+        if roster is not None:
+            # Human player first, then AI players, skipping the eliminated
+            players = roster.active_players()
+        else:
+            players = []
+            
+            # Add human player if exists and not eliminated
+            if self.player is not None and not getattr(self.player, 'eliminated', False):
+                players.append(self.player)
+            
+            # Add AI players that are not eliminated
+            for ai_player in self.ai_players:
+                if not getattr(ai_player, 'eliminated', False):
+                    players.append(ai_player)
         
         # If no players found (shouldn't happen in normal game flow)
         if not players and self.characters:
@@ -271,3 +268,20 @@ class PlayerManager:
             players = [p for p in self.characters if not getattr(p, 'eliminated', False)]
         
         return players
+    
+    def _seated_roster(self) -> Optional[PlayerRoster]:
+        """
+        Get the roster of the seated players (human first, then AI).
+        
+        The roster is rebuilt when the human player or the AI player list
+        changes. Returns None if a seated player is not a Player, since only
+        Players mirror their elimination into the roster.
+        """
+        player, ai_players = self.player, self.ai_players
+        source = self._roster_source
+        if (source is None or source[0] is not player or source[1] is not ai_players
+                or source[2] != len(ai_players)):
+            seated = ([] if player is None else [player]) + list(ai_players)
+            self._roster = PlayerRoster(seated) if all(isinstance(p, Player) for p in seated) else None
+            self._roster_source = (player, ai_players, len(ai_players))
+        return self._roster
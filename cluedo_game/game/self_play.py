@@ -0,0 +1,97 @@
+"""
+AI-only self-play for the Cluedo game.
+
+This module runs headless games between AI players, one process per game,
+for exercising and benchmarking the AI.
+"""
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from cluedo_game.solution import create_solution
+from .core import CluedoGame
+from .ui import GameUI
+
+# (seed, finished, winner name, turns played)
+GameSummary = Tuple[int, bool, Optional[str], int]
+
+
+def _silent(*args, **kwargs) -> None:
+    """Discard game output."""
+
+
+def _no_input(prompt: str = "") -> str:
+    """Answer every prompt with an empty line."""
+    return ""
+
+
+def _setup_game(seed: int) -> CluedoGame:
+    """
+    Set up a silent AI-only game with its cards dealt.
+    
+    Args:
+        seed: Seed for the game's generator and the random module
+        
+    Returns:
+        CluedoGame: The game, ready to play
+    """
+    # Each worker process has its own random module; seed it for this game
+    random.seed(seed)
+    
+    game = CluedoGame(input_func=_no_input, output_func=_silent, with_ai=True, verbose=False)
+    game.ui = GameUI(input_func=_no_input, output_func=_silent)
+    game.rng = np.random.default_rng(seed)
+    game.solution = create_solution(game.rng)
+    
+    # The first AI player takes the human player's seat, leaving the rest as
+    # its opponents, so every AI is seated (and dealt cards) exactly once
+    manager = game.player_manager
+    manager.setup_ai_only_players()
+    manager.ai_players = manager.ai_players[1:]
+    game.player, game.ai_players = manager.player, manager.ai_players
+    game.players = [game.player, *game.ai_players]
+    manager.deal_cards()
+    return game
+
+
+def run_one_game(seed: int, max_turns: int = 100) -> GameSummary:
+    """
+    Play one AI-only game without any input or output.
+    
+    Args:
+        seed: Seed for the game's generator and the random module
+        max_turns: Maximum number of turns before the game is abandoned
+        
+    Returns:
+        GameSummary: The seed, whether the game finished, the winner's name
+        (None if nobody won) and the number of turns played
+    """
+    game = _setup_game(seed)
+    finished = game.game_loop.play(max_turns)
+    
+    # A correct accusation names the winner; otherwise the last player standing wins
+    winner = getattr(game, 'winner', None)
+    if winner is None:
+        survivor = game.win_condition_checker.check_win_condition()
+        winner = survivor.name if survivor else None
+    return seed, finished, winner, game.game_loop.turn_counter
+
+
+def run_games(seeds: Iterable[int], max_turns: int = 100,
+              max_workers: Optional[int] = None) -> List[GameSummary]:
+    """
+    Play one AI-only game per seed, spread over worker processes.
+
+    Args:
+        seeds: Seeds of the games to play
+        max_turns: Maximum number of turns per game
+        max_workers: Number of worker processes (default: one per CPU)
+
+    Returns:
+        List[GameSummary]: The summary of each game, in seed order
+    """
+    seeds = list(seeds)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_one_game, seeds, [max_turns] * len(seeds)))
@@ -226,8 +226,7 @@ class GameUI:
         Args:
             players: List of player dictionaries with 'name', 'position', and 'eliminated' keys
         """
-        self.output("\nCurrent Player Locations:")
-        self.output("-" * 30)
+        lines = ["\nCurrent Player Locations:", "-" * 30]
         for player in players:
             if player.get('eliminated'):
                 status = "(Eliminated)"
@@ -237,7 +236,8 @@ class GameUI:
             pos = player.get('position', 'Unknown')
             chess_coord = self.game.mansion.get_chess_coordinate(pos) if hasattr(self, 'game') and hasattr(self.game, 'mansion') else ""
             chess_display = f" [{chess_coord}]" if chess_coord else ""
-            self.output(f"{player.get('name', 'Unknown')}: {pos}{chess_display} {status}")
+            lines.append(f"{player.get('name', 'Unknown')}: {pos}{chess_display} {status}")
+        self.output("\n".join(lines))
     
     def show_suggestion_history(self, suggestion_history) -> None:
         """
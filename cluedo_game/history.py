@@ -15,10 +15,15 @@ class SuggestionHistory:
     def get_all(self):
         return self.records
 
+    def __len__(self):
+        return len(self.records)
+
+    def __bool__(self):
+        # Truthiness without rendering the table
+        return bool(self.records)
+
     def __str__(self):
-        try:
-            first = self.records[0]
-        except IndexError:
+        if not self.records:
             return "No suggestions yet."
 
         # Prepare all data rows first
@@ -0,0 +1,26 @@
+"""
+Integer IDs for the 21 Cluedo cards.
+
+Suspects take IDs 0-5, weapons 6-11 and rooms 12-20, in the order of the
+card lists in cluedo_game.cards, so a set of cards fits in an int bitmask.
+"""
+from cluedo_game.cards import SUSPECTS, WEAPONS, ROOMS
+
+# Card names in ID order, and name -> ID
+CARD_NAMES = (tuple(suspect.name for suspect in SUSPECTS) +
+              tuple(weapon.name for weapon in WEAPONS) +
+              tuple(ROOMS))
+CARD_ID = {name: i for i, name in enumerate(CARD_NAMES)}
+
+def card_id(card):
+    """Return the ID of a card, Room or card name, or None if it is not a Cluedo card."""
+    return CARD_ID.get(getattr(card, 'name', card))
+
+def card_mask(cards):
+    """Return the bitmask with the ID bit of each known card in cards set."""
+    mask = 0
+    for card in cards:
+        i = card_id(card)
+        if i is not None:
+            mask |= 1 << i
+    return mask
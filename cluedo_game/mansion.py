@@ -2,8 +2,32 @@
 Representation of the mansion layout for the Cluedo game.
 Contains different rooms such as kitchen, library, ballroom, etc.
 """
+from enum import IntEnum
+
+
+class PosKind(IntEnum):
+    """Whether a board space is a corridor or a room."""
+    CORRIDOR = 0
+    ROOM = 1
+
+def space_kind(space):
+    """
+    Return the PosKind of a space (a Room, room name or corridor name).
+    
+    Room objects carry their kind. Corridors are named C followed by digits;
+    any other name is a room. Use Mansion.kind_of for spaces on a board.
+    """
+    if type(space) is Room:
+        return space.kind
+    name = getattr(space, 'name', space)
+    if isinstance(name, str) and name[:1] == 'C' and name[1:].isdigit():
+        return PosKind.CORRIDOR
+    return PosKind.ROOM
 
 class Room:
+    # Every Room is a room space, whatever its name
+    kind = PosKind.ROOM
+
     def __init__(self, name):
         self.name = name
     def __repr__(self):
@@ -76,6 +100,14 @@ class Mansion:
         # Reverse mapping from chess coordinates to spaces
         self.spaces_by_coordinates = {coord: space for space, coord in self.chess_coordinates.items()}
         
+        # Chess coordinate and kind of every space, keyed by name and by Room,
+        # so menus and turns look them up without normalising names
+        self._chess_coord = dict(self.chess_coordinates)
+        self._chess_coord.update((room, self.chess_coordinates[room.name]) for room in self.rooms)
+        self._kind = {corridor: PosKind.CORRIDOR for corridor in self.corridors}
+        for room in self.rooms:
+            self._kind[room] = self._kind[room.name] = PosKind.ROOM
+        
         # Secret passages connect specific rooms diagonally across the board
         self.secret_passages = {
             self.room_lookup["Kitchen"]: self.room_lookup["Study"],
@@ -112,6 +144,14 @@ class Mansion:
             self.room_lookup["Hall"]: ["C7", "C12"],
         }
         
+        # Integer ID for each space in the adjacency map, and the rooms next
+        # to each space indexed by that ID (rooms only border corridors)
+        self._space_ids = {space: i for i, space in enumerate(self.adjacency)}
+        self._adjacent_rooms_by_id = [
+            () if isinstance(space, Room) else tuple(s for s in adjacent if isinstance(s, Room))
+            for space, adjacent in self.adjacency.items()
+        ]
+        
     def get_room(self, position):
         """Get the Room object for a given position if it's a room.
         
@@ -175,12 +215,24 @@ class Mansion:
         Returns:
             List[Room]: List of adjacent rooms (empty list if none)
         """
-        # For rooms, they should only be adjacent to corridors, not other rooms
-        if space in self.rooms:
+        # Rooms are only adjacent to corridors, so their entries are empty;
+        # corridors list their adjacent rooms (not other corridors)
+        i = self._space_ids.get(space)
+        if i is None:
             return []
-            
-        # For corridors, return adjacent rooms (not other corridors)
-        return [s for s in self.adjacency.get(space, []) if s in self.rooms]
+        return list(self._adjacent_rooms_by_id[i])
+        
+    def kind_of(self, space):
+        """Return the PosKind of a space (a Room, room name or corridor name)."""
+        kind = self._kind.get(space)
+        if kind is None:
+            # Not a space on this board; go by the corridor naming
+            kind = space_kind(space)
+        return kind
+    
+    def is_corridor(self, space):
+        """Return True if the space (a Room, room name or corridor name) is a corridor."""
+        return self.kind_of(space) is PosKind.CORRIDOR
         
     def get_chess_coordinate(self, space):
         """Convert a space name or Room object to its chess coordinate (e.g., A1, B2).
@@ -194,6 +246,11 @@ class Mansion:
         if space is None:
             return None
             
+        # Spaces of this board, given exactly, are looked up directly
+        coord = self._chess_coord.get(space)
+        if coord is not None:
+            return coord
+            
         # If it's a Room object, get its name
         if hasattr(space, 'name'):
             space = space.name
@@ -6,6 +6,8 @@ import logging
 from collections import deque
 from typing import List, Dict, Any, Set, Tuple, Union, Optional
 
+from cluedo_game.mansion import PosKind, space_kind
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,10 @@ class Movement:
         self._secret_passage_rooms = {
             'Kitchen', 'Study', 'Conservatory', 'Lounge'
         }
+        # (start position, steps) -> sorted destinations; the board never changes
+        self._dest_cache: Dict[Tuple[Any, int], Tuple[str, ...]] = {}
+        # Rendered board listing, built on first display
+        self._board_text: Optional[str] = None
 
     def _is_secret_passage_move(self, from_pos, to_pos):
         """
@@ -35,8 +41,7 @@ class Movement:
             bool: True if this move uses a secret passage, False otherwise
         """
         # If either position is a corridor, it's not a secret passage move
-        if (isinstance(from_pos, str) and from_pos.startswith('C')) or \
-           (isinstance(to_pos, str) and to_pos.startswith('C')):
+        if space_kind(from_pos) is PosKind.CORRIDOR or space_kind(to_pos) is PosKind.CORRIDOR:
             return False
             
         # If either position isn't a room (after checking for corridors), it's not a secret passage
@@ -78,12 +83,15 @@ class Movement:
         if steps <= 0:
             return []
             
+        # The search depends only on the start and the roll, so reuse earlier results
+        cache_key = (start_position, steps)
+        cached = self._dest_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+            
         # Convert string room names to Room objects
-        if isinstance(start_position, str) and not start_position.startswith('C'):
-            for room in self.mansion.rooms:
-                if room.name == start_position:
-                    start_position = room
-                    break
+        if isinstance(start_position, str) and space_kind(start_position) is PosKind.ROOM:
+            start_position = self.mansion.room_lookup.get(start_position, start_position)
         
         # Track visited positions with their distances and secret passage usage
         visited = {}  # (position_key, used_secret_passage) -> distance
@@ -141,7 +149,9 @@ class Movement:
             display_name = f"{pos_key} (via secret passage)" if used_secret_passage else pos_key
             final_destinations.add(display_name)
                 
-        return sorted(final_destinations, key=str)
+        destinations = tuple(sorted(final_destinations, key=str))
+        self._dest_cache[cache_key] = destinations
+        return list(destinations)
     
     def display_board(self) -> None:
         """Display the board layout with chess coordinates."""
@@ -149,6 +159,15 @@ class Movement:
             print("\nBoard display not available: no chess coordinates found.")
             return
             
+        if self._board_text is None:
+            self._board_text = self._render_board()
+        if hasattr(self.mansion, 'output'):
+            self.mansion.output(self._board_text)
+        else:
+            print(self._board_text)
+    
+    def _render_board(self) -> str:
+        """Build the board listing shown by display_board."""
         output = []
         
         # Add rooms section
@@ -189,12 +208,7 @@ class Movement:
         output.append("- Kitchen <-> Study")
         output.append("- Conservatory <-> Lounge")
         
-        # Print the output
-        full_output = '\n'.join(output)
-        if hasattr(self.mansion, 'output'):
-            self.mansion.output(full_output)
-        else:
-            print(full_output)
+        return '\n'.join(output)
     
     def get_optimal_path(self, start_position, end_position, max_steps=None):
         """
@@ -238,8 +252,6 @@ class Movement:
             return []
                 
         # For longer paths, use BFS
-        from collections import deque
-            
         # Queue items are (current_position, path_taken, steps_used, used_secret_passage)
         queue = deque()
         visited = set()
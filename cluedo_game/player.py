@@ -1,3 +1,5 @@
+import numpy as np
+
 from cluedo_game.cards import SuspectCard
 
 class Player:
@@ -5,13 +7,31 @@ class Player:
     Represents a player (human or AI) in the Cluedo game.
     Tracks hand, position, and elimination status.
     """
+    # Players are touched every turn; slots keep their attributes in fixed
+    # offsets rather than a per-instance dict
+    __slots__ = ("character", "is_human", "hand", "_eliminated", "_position",
+                 "_roster", "_seat")
+
     def __init__(self, character: SuspectCard, is_human=True):
+        # Roster this player's position and elimination are mirrored into, if any
+        self._roster = None
+        self._seat = 0
         self.character = character
         self.is_human = is_human
         self.hand = []
         self.eliminated = False  # True if player made a false accusation
         self._position = None  # Store position directly in Player
 
+    @property
+    def eliminated(self):
+        return self._eliminated
+
+    @eliminated.setter
+    def eliminated(self, value):
+        self._eliminated = value
+        if self._roster is not None:
+            self._roster.eliminated[self._seat] = value
+
     @property
     def name(self):
         return self.character.name
@@ -19,7 +39,6 @@ class Player:
     @name.setter
     def name(self, value):
         # Create a new SuspectCard with the new name
-        from cluedo_game.cards import SuspectCard
         self.character = SuspectCard(value)
 
     @property
@@ -29,6 +48,8 @@ class Player:
     @position.setter
     def position(self, value):
         self._position = value
+        if self._roster is not None:
+            self._roster.positions[self._seat] = value
         
     @property
     def is_eliminated(self):
@@ -39,3 +60,33 @@ class Player:
 
     def __repr__(self):
         return f"Player({self.character}, hand={self.hand}, is_human={self.is_human})"
+
+
+class PlayerRoster:
+    """
+    The elimination flags and positions of a table of players, held in
+    parallel arrays indexed by seat so a whole-table scan is one array op.
+
+    Each player is bound to the roster on creation and mirrors later writes
+    to its position and elimination into it.
+    """
+
+    def __init__(self, players):
+        self.players = list(players)
+        self.index = {player: seat for seat, player in enumerate(self.players)}
+        count = len(self.players)
+        self.eliminated = np.zeros(count, dtype=bool)
+        self.positions = np.empty(count, dtype=object)
+        for seat, player in enumerate(self.players):
+            self.eliminated[seat] = player.eliminated
+            self.positions[seat] = player.position
+            player._roster, player._seat = self, seat
+
+    def active_seats(self):
+        """Return the seats of the players not yet eliminated."""
+        return np.flatnonzero(~self.eliminated)
+
+    def active_players(self):
+        """Return the players not yet eliminated, in seat order."""
+        players = self.players
+        return [players[seat] for seat in self.active_seats()]
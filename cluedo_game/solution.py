@@ -1,9 +1,10 @@
 """
 Encapsulate the solution to the murder: one character, one weapon, and one room.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import random
-from typing import Optional
+import sys
+from typing import Optional, Tuple, Any
 
 from cluedo_game.cards import SuspectCard, WeaponCard, RoomCard
 from cluedo_game.character import get_characters
@@ -16,18 +17,30 @@ class Solution:
     character: SuspectCard
     weapon: WeaponCard
     room: str
+    # Interned (character, weapon, room) names, fixed for the whole game
+    key: Tuple[str, str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.key = tuple(
+            sys.intern(name) if type(name) is str else name
+            for name in (self.character.name, self.weapon.name,
+                         getattr(self.room, 'name', self.room))
+        )
 
     @staticmethod
-    def random_solution():
+    def random_solution(rng=None):
+        # Draw from the game's numpy Generator when given one, else the random module
+        choice = random.choice if rng is None else (lambda seq: seq[int(rng.integers(len(seq)))])
+        
         # Get physical entities first
-        character_obj = random.choice(get_characters())
-        weapon_obj = random.choice(get_weapons())
-        room_name = random.choice(Mansion().get_rooms())
+        character_obj = choice(get_characters())
+        weapon_obj = choice(get_weapons())
+        room_obj = choice(Mansion().get_rooms())
         
         # Create cards from those entities
         character = SuspectCard(character_obj.name)
         weapon = WeaponCard(weapon_obj.name)
-        room = RoomCard(room_name)
+        room = RoomCard(getattr(room_obj, 'name', room_obj))
         
         return Solution(character, weapon, room)
 
@@ -41,6 +54,19 @@ class Solution:
         room_name = self.room.name if hasattr(self.room, 'name') else str(self.room)
         return f"Solution: {self.character.name} with the {self.weapon.name} in the {room_name}"
 
-def create_solution() -> Solution:
-    """Create a random solution for the game."""
-    return Solution.random_solution()
+def solution_key(solution: Any) -> Tuple[Any, Any, Any]:
+    """
+    Return the (character, weapon, room) names of a solution.
+    
+    Uses the precomputed key of a Solution; other solution-like objects
+    have their names read off their attributes.
+    """
+    if isinstance(solution, Solution):
+        return solution.key
+    room = solution.room
+    return (solution.character.name, solution.weapon.name,
+            room.name if hasattr(room, 'name') else room)
+
+def create_solution(rng=None) -> Solution:
+    """Create a random solution for the game, optionally drawn from a numpy Generator."""
+    return Solution.random_solution(rng)
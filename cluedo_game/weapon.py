@@ -25,28 +25,28 @@ class Weapon:
             return self.name == other.name
         return False
 
-# List of physical weapons in the mansion
-WEAPONS = [
+# Physical weapons in the mansion
+WEAPONS = (
     Weapon("Candlestick"),
     Weapon("Dagger"),
     Weapon("Lead Pipe"),
     Weapon("Revolver"),
     Weapon("Rope"),
     Weapon("Wrench")
-]
+)
+
+# Physical weapons keyed by name, for constant-time lookup
+_WEAPONS_BY_NAME = {weapon.name: weapon for weapon in WEAPONS}
 
 # Weapon cards corresponding to physical weapons
-WEAPON_CARDS = [
+WEAPON_CARDS = tuple(
     WeaponCard(weapon.name) for weapon in WEAPONS
-]
+)
 
 def get_weapons():
-    """Return a list of all weapon instances."""
+    """Return a tuple of all weapon instances."""
     return WEAPONS
 
 def get_weapon_by_name(name):
     """Return a weapon instance by name, or None if not found."""
-    for weapon in WEAPONS:
-        if weapon.name == name:
-            return weapon
-    return None
+    return _WEAPONS_BY_NAME.get(name)
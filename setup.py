@@ -5,8 +5,7 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
-        # Add your project's dependencies here
-        # e.g., 'numpy>=1.20.0',
+        'numpy>=1.20.0',
     ],
     # Add any additional configuration as needed
 )
@@ -356,6 +356,16 @@ class TestMovement:
                     coord = match.group(1)
                     assert re.fullmatch(coord_pattern, coord), f"Invalid coordinate format: {coord}"
 
+    def test_display_board_renders_once(self, movement, capsys):
+        """Test that the board listing is built once and reused."""
+        movement.display_board()
+        first = capsys.readouterr().out
+        
+        with patch.object(movement, '_render_board') as render:
+            movement.display_board()
+        assert capsys.readouterr().out == first
+        render.assert_not_called()
+
     def test_init(self, mock_mansion):
         """Test the initialization of the Movement class."""
         movement = Movement(mock_mansion)
@@ -505,6 +515,17 @@ class TestMovement:
         assert 'C1' not in dest_names  # Starting point
         assert 'Billiard Room' not in dest_names  # 3 steps away
     
+    def test_get_destinations_from_is_cached(self, movement, mock_mansion):
+        """Test that repeated queries reuse the first search and return fresh lists."""
+        mock_mansion.get_adjacent_spaces.side_effect = lambda space: {'C1': ['C2'], 'C2': ['C1']}.get(space, [])
+        
+        first = movement.get_destinations_from('C1', 2)
+        calls = mock_mansion.get_adjacent_spaces.call_count
+        first.append('Hall')
+        
+        assert movement.get_destinations_from('C1', 2) == ['C2']
+        assert mock_mansion.get_adjacent_spaces.call_count == calls
+    
     def test_get_optimal_path_same_position(self, movement):
         """Test finding an optimal path when start and end are the same."""
         path = movement.get_optimal_path('Kitchen', 'Kitchen')
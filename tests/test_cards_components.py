@@ -19,6 +19,9 @@ from cluedo_game.weapon import (
     get_weapon_by_name
 )
 
+from cluedo_game.ids import CARD_NAMES, card_id, card_mask
+from cluedo_game.mansion import Room
+
 from cluedo_game.character import (
     Character,
     CHARACTER_NAMES,
@@ -47,6 +50,18 @@ class TestCards:
         assert card1 == card2
         assert card1 != card3
     
+    def test_card_hash_matches_equality(self):
+        """Test equal cards hash alike and cards of different types do not collide."""
+        assert hash(WeaponCard("Rope")) == hash(WeaponCard("Rope"))
+        assert len({WeaponCard("Rope"), WeaponCard("Rope"), RoomCard("Rope")}) == 2
+    
+    def test_cards_use_slots(self):
+        """Test card instances carry no per-instance __dict__."""
+        for card in (Card("Test Card"), SuspectCard("Colonel Mustard"),
+                     WeaponCard("Rope"), RoomCard("Kitchen")):
+            assert not hasattr(card, '__dict__')
+        assert not hasattr(Character("Miss Scarlett", "C1"), '__dict__')
+    
     def test_card_str_representation(self):
         """Test the string representation of a Card instance."""
         card = Card("Test Card")
@@ -129,6 +144,19 @@ class TestCards:
         for position in CARD_STARTING_SPACES.values():
             assert position in valid_positions
 
+    def test_card_ids(self):
+        """Test every card has a distinct ID whatever form it is given in."""
+        assert len(CARD_NAMES) == 21
+        assert sorted(card_id(name) for name in CARD_NAMES) == list(range(21))
+        assert card_id(WeaponCard("Rope")) == card_id("Rope")
+        assert card_id(Room("Kitchen")) == card_id(RoomCard("Kitchen"))
+        assert card_id("Nowhere") is None
+    
+    def test_card_mask(self):
+        """Test card masks set one bit per known card."""
+        mask = card_mask([SuspectCard("Mrs. White"), "Rope", "Nowhere"])
+        assert mask == (1 << card_id("Mrs. White")) | (1 << card_id("Rope"))
+
 #------------------------------------------------------------------------------
 # Weapon Tests
 #------------------------------------------------------------------------------
@@ -314,25 +342,13 @@ class TestCharacter:
             assert character.name == name
             assert character.position == CHARACTER_STARTING_SPACES[name]
 
+    def test_get_character_by_name_reuses_instances(self):
+        """Test lookups return the same Character instances as get_characters."""
+        characters = {character.name: character for character in get_characters()}
+        for name in CHARACTER_NAMES:
+            assert get_character_by_name(name) is characters[name]
+
     def test_get_character_by_name_invalid(self):
         """Test get_character_by_name returns None for invalid name."""
         character = get_character_by_name("Nonexistent Character")
         assert character is None
-
-    def test_get_character_by_name_handles_exceptions(self, monkeypatch):
-        """Test get_character_by_name properly handles AttributeError exceptions."""
-        # Create a mock list of "characters" where one item will raise AttributeError
-        # when its name is accessed
-        class MockCharacterWithoutName:
-            @property
-            def name(self):
-                raise AttributeError("No name attribute")
-        
-        mock_character_list = [MockCharacterWithoutName()]
-        
-        # We need to patch get_characters to return our mock list
-        monkeypatch.setattr('cluedo_game.character.get_characters', lambda: mock_character_list)
-        
-        # Test that the function handles the exception gracefully
-        result = get_character_by_name("Some Name")
-        assert result is None
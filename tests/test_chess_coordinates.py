@@ -4,7 +4,7 @@ Tests for the chess coordinate functionality in the Mansion class.
 import pytest
 from unittest.mock import MagicMock, patch
 
-from cluedo_game.mansion import Mansion, Room
+from cluedo_game.mansion import Mansion, Room, PosKind, space_kind
 
 
 class TestChessCoordinates:
@@ -150,7 +150,30 @@ class TestChessCoordinates:
         for input_str, expected_coord in test_cases:
             coord = mansion.get_chess_coordinate(input_str)
             assert coord == expected_coord, f"{input_str} should map to {expected_coord}, got {coord}"
-        
+
+    def test_is_corridor(self, mansion):
+        """Test telling corridors from rooms, including rooms whose names start with C."""
+        for corridor in mansion.corridors:
+            assert mansion.is_corridor(corridor) is True
+        for room in mansion.rooms:
+            assert mansion.is_corridor(room) is False
+            assert mansion.is_corridor(room.name) is False
+        assert mansion.is_corridor("Conservatory") is False
+        assert mansion.is_corridor("C42") is True
+        assert mansion.is_corridor(None) is False
+    
+    def test_kind_of(self, mansion):
+        """Test tagging spaces as corridors or rooms, on and off the board."""
+        assert mansion.kind_of("C12") is PosKind.CORRIDOR
+        assert mansion.kind_of(mansion.rooms[0]) is PosKind.ROOM
+        assert mansion.kind_of("Conservatory") is PosKind.ROOM
+        assert space_kind("C42") is PosKind.CORRIDOR
+        assert space_kind(Room("Cellar")) is PosKind.ROOM
+        assert space_kind(Room("C3")) is PosKind.ROOM
+        assert space_kind(None) is PosKind.ROOM
+        import cluedo_game.mansion as mansion_module
+        assert not hasattr(mansion_module, "_SPACE_KINDS")
+
     def test_get_space_from_coordinate(self, mansion):
         """Test getting space name from chess coordinates with various inputs."""
         # Test all room coordinates
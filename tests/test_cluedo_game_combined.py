@@ -9,9 +9,15 @@ Aims to achieve 90%+ code coverage.
 """
 import pytest
 import logging
+import numpy as np
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch, call
 
-from cluedo_game.game import CluedoGame
+from cluedo_game.game import CluedoGame, GameInitializer
+from cluedo_game.game.initialization import _init_logger
+from cluedo_game.game.game_loop import GameLoop
+from cluedo_game.game.self_play import _setup_game, run_one_game, run_games
 from cluedo_game.mansion import Mansion, Room
 from cluedo_game.solution import Solution
 from cluedo_game.history import SuggestionHistory
@@ -222,13 +228,12 @@ class TestCluedoGame:
         assert game.player in game.characters
         
         # Verify UI was called to show character selection
-        mock_ui.show_message.assert_any_call("Select your character:")
+        menu = mock_ui.show_message.call_args_list[0][0][0].split("\n")
+        assert menu[0] == "Select your character:"
         
         # Verify the first character's info was shown (position and chess coordinate)
         first_char = game.characters[0]
-        mock_ui.show_message.assert_any_call(
-            f"  1. {first_char.name} (starts in {first_char.position} [A1])"
-        )
+        assert menu[1] == f"  1. {first_char.name} (starts in {first_char.position} [A1])"
         
         # Verify the player was set up correctly
         assert game.player.is_human is True
@@ -287,12 +292,11 @@ class TestCluedoGame:
             assert ai_game.player.name not in ai_player_names
             
             # Verify UI was called to show character selection
-            mock_ui.show_message.assert_any_call("Select your character:")
+            menu = mock_ui.show_message.call_args_list[0][0][0].split("\n")
+            assert menu[0] == "Select your character:"
             
             # Verify the first character's info was shown (position and chess coordinate)
-            mock_ui.show_message.assert_any_call(
-                f"  1. {first_char.name} (starts in {first_char.position} [A1])"
-            )
+            assert menu[1] == f"  1. {first_char.name} (starts in {first_char.position} [A1])"
             
             # Verify the AI players were created correctly
             assert len(mock_ai_players) == expected_ai_count
@@ -341,6 +345,39 @@ class TestCluedoGame:
         assert len(all_ai_players) > 0
         assert ai_game.player in all_ai_players  # Human player should be in the list
         assert len(all_ai_players) > len([ai_game.player])  # Should include AI players too
+
+    def test_get_all_players_cached(self, ai_game):
+        """Test that get_all_players is reused until the human player changes."""
+        first = ai_game.get_all_players()
+        assert ai_game.get_all_players() is first
+        
+        ai_game.player = ai_game.characters[2]
+        players = ai_game.get_all_players()
+        assert players is not first
+        assert players[0] is ai_game.player
+        assert len(players) == len(ai_game.characters)
+
+    def test_game_import_defers_ai(self):
+        """Test that importing the game package does not load the AI package."""
+        loaded = subprocess.run(
+            [sys.executable, "-c", "import sys, cluedo_game.game; print('cluedo_game.ai' in sys.modules)"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        assert loaded == "False"
+
+    def test_logging_configured_once(self):
+        """Test that GameInitializer reads logger.conf only once per process."""
+        _init_logger.cache_clear()
+        try:
+            with patch('logging.config.fileConfig') as mock_file_config:
+                first, second = GameInitializer(), GameInitializer()
+                first._setup_logging()
+                second._setup_logging()
+            
+            mock_file_config.assert_called_once_with('logger.conf')
+            assert first.logger is second.logger
+        finally:
+            _init_logger.cache_clear()
         
 
 # -----------------------------------------------------------------------------
@@ -664,7 +701,92 @@ class TestGamePlay:
                 weapon='Candlestick',
                 room='Kitchen'
             )
-    
+
+    def test_make_suggestion_refuted(self, mock_game_play):
+        """Test that make_suggestion shows a card held by another player."""
+        game = mock_game_play
+        game.players = [Player(SuspectCard(name)) for name in ("Miss Scarlett", "Colonel Mustard", "Mrs. White")]
+        game.player = game.players[0]
+        game.player.position = 'Kitchen'
+        game.players[1].hand = [SuspectCard("Mrs. Peacock")]
+        game.players[2].hand = [RoomCard("Library"), WeaponCard("Rope")]
+        weapon_choice = game._weapon_names.index("Rope") + 1
+        game.input = MagicMock(side_effect=['1', str(weapon_choice)])
+
+        assert game.make_suggestion() is False
+        game.output.assert_any_call("Mrs. White shows you: Rope")
+
+    def test_make_suggestion_asks_players_in_turn_order(self, mock_game_play):
+        """Test that make_suggestion asks the players after the suggester first."""
+        game = mock_game_play
+        game.players = [Player(SuspectCard(name)) for name in ("Miss Scarlett", "Colonel Mustard", "Mrs. White")]
+        game.player = game.players[1]
+        game.player.position = 'Kitchen'
+        game.players[0].hand = [WeaponCard("Rope")]
+        game.players[2].hand = [WeaponCard("Rope")]
+        weapon_choice = game._weapon_names.index("Rope") + 1
+        game.input = MagicMock(side_effect=['1', str(weapon_choice)])
+
+        game.make_suggestion()
+        game.output.assert_any_call("Mrs. White shows you: Rope")
+        assert call("Miss Scarlett shows you: Rope") not in game.output.call_args_list
+
+    def test_get_refutation(self, mock_game_play):
+        """Test that refutations follow the players' current hands."""
+        scarlett, mustard, white = mock_game_play.characters
+        mustard.hand = [WeaponCard("Rope"), SuspectCard("Mrs. Peacock")]
+        get_refutation = mock_game_play.action_handler._get_refutation
+
+        assert get_refutation(scarlett, "Mrs. Peacock", "Rope", "Kitchen") == (mustard, SuspectCard("Mrs. Peacock"))
+
+        mustard.hand.clear()
+        white.hand.append(RoomCard("Kitchen"))
+        assert get_refutation(scarlett, "Mrs. Peacock", "Rope", "Kitchen") == (white, RoomCard("Kitchen"))
+        assert get_refutation(scarlett, "Mrs. Peacock", "Rope", "Hall") == (None, None)
+
+    def test_handle_refutation(self, mock_game_play):
+        """Test the refutation hook AI players call with cards and Room objects."""
+        scarlett, mustard, white = mock_game_play.characters
+        white.hand = [RoomCard("Kitchen")]
+        
+        assert mock_game_play.handle_refutation(
+            SuspectCard("Mrs. Peacock"), WeaponCard("Rope"), Room("Kitchen"), scarlett) == ("Mrs. White", RoomCard("Kitchen"))
+        assert mock_game_play.handle_refutation(
+            SuspectCard("Mrs. Peacock"), WeaponCard("Rope"), Room("Hall"), scarlett) == (None, None)
+
+    def test_prompt_choice(self, mock_game_play):
+        """Test that _prompt_choice re-prompts until it gets a listed number."""
+        game = mock_game_play
+        on_history = MagicMock()
+        game.input = MagicMock(side_effect=['x', '0', '-1', 'H', ' 2 '])
+
+        assert game._prompt_choice(['a', 'b'], "Pick: ", "Options:", on_history) == 1
+        on_history.assert_called_once_with()
+        game.output.assert_any_call("Options:\n1. a\n2. b")
+        game.output.assert_any_call("Please enter a number between 1 and 2.")
+        game.output.assert_any_call("Please enter a valid number or 'h' for history.")
+
+    def test_prompt_choice_skip(self, mock_game_play):
+        """Test that an empty answer skips the choice only when skipping is allowed."""
+        game = mock_game_play
+        game.input = MagicMock(side_effect=['', '1'])
+        assert game._prompt_choice(['a'], "Pick: ") == 0
+        game.output.assert_any_call("Please enter a valid number.")
+
+        game.input = MagicMock(return_value='')
+        assert game._prompt_choice(['a'], "Pick: ", allow_skip=True) is None
+        assert game.action_handler._get_human_destination_choice(['Hall']) is None
+
+    def test_prompt_accusation_cancelled(self, mock_game_play):
+        """Test that prompt_accusation offers room names and honours a cancel."""
+        mock_game_play.input = MagicMock(side_effect=['1', '1', '1', 'n'])
+
+        assert mock_game_play.prompt_accusation() is False
+        mock_game_play.output.assert_any_call("\n".join(["\nSelect the room where it happened:",
+                                                          *(f"{i}. {room}" for i, room in enumerate(mock_game_play._room_names, 1))]))
+        assert mock_game_play._room_names[0] == "Kitchen"
+        mock_game_play.output.assert_any_call("Accusation cancelled.")
+
     def test_make_accusation(self, mock_game_play):
         """Test the make_accusation method."""
         # Setup test data
@@ -789,7 +911,33 @@ class TestGamePlay:
         for player in players:
             assert len(player.hand) > 0, f"Player {player.name} has no cards"
             print(f"Player {player.name} has {len(player.hand)} cards: {[str(card) for card in player.hand]}")
-    
+
+    def test_deal_cards_excludes_solution(self, mock_game_play):
+        """Test that deal_cards deals every card except the solution's."""
+        players = [Player(SuspectCard(name)) for name in ("Miss Scarlett", "Colonel Mustard", "Mrs. White")]
+        mock_game_play.player_manager = MagicMock()
+        mock_game_play.player_manager.get_all_active_players.return_value = players
+        mock_game_play.solution = Solution(SuspectCard("Professor Plum"), WeaponCard("Rope"), RoomCard("Study"))
+
+        mock_game_play.deal_cards()
+
+        dealt = [getattr(card, 'name', card) for player in players for card in player.hand]
+        assert [len(player.hand) for player in players] == [6, 6, 6]
+        assert not {"Professor Plum", "Rope", "Study"} & set(dealt)
+
+    def test_player_manager_deal_cards_excludes_solution(self, mock_game_play):
+        """Test that PlayerManager.deal_cards never deals a solution card."""
+        manager = mock_game_play.player_manager
+        manager.player = Player(SuspectCard("Miss Scarlett"))
+        manager.ai_players = [Player(SuspectCard("Colonel Mustard"), is_human=False)]
+        mock_game_play.solution = Solution(SuspectCard("Professor Plum"), WeaponCard("Rope"), "Study")
+
+        manager.deal_cards()
+
+        assert len(manager.player.hand) == len(manager.ai_players[0].hand) == 9
+        dealt = manager.player.hand + manager.ai_players[0].hand
+        assert not {SuspectCard("Professor Plum"), WeaponCard("Rope"), RoomCard("Study")} & set(dealt)
+
     def test_check_win_one_player_left(self, mock_game_play):
         """Test the check_win method when only one player is left."""
         # Setup only one active player
@@ -804,6 +952,15 @@ class TestGamePlay:
         
         # Should return True since only one player remains
         assert result is True
+        assert mock_game_play.winner == "Miss Scarlett"
+    
+    def test_check_win_two_players_left(self, mock_game_play):
+        """Test that check_win continues the game while two players remain."""
+        players = [Character(name, "C1") for name in ("Miss Scarlett", "Colonel Mustard", "Mrs. White")]
+        players[0].eliminated = True
+        mock_game_play.get_all_players = MagicMock(return_value=players)
+        
+        assert mock_game_play.check_win() is False
     
     def test_play_standard(self, mock_game_play):
         """Test the _play_standard method."""
@@ -822,8 +979,8 @@ class TestGamePlay:
         mock_game_play.ui.show_player_turn = MagicMock()
         mock_game_play.ui.show_game_over = MagicMock()
         
-        # Set up the check_win to return False first, then True to end the game
-        mock_game_play.check_win = MagicMock(side_effect=[False, True])
+        # The game should end on its own without consulting check_win
+        mock_game_play.check_win = MagicMock()
         
         # Mock the suggestion_phase to avoid side effects
         mock_game_play.suggestion_phase = MagicMock()
@@ -839,8 +996,135 @@ class TestGamePlay:
         
         # Verify that process_human_turn was called
         assert mock_game_play.process_human_turn.called, "process_human_turn should be called"
-        assert mock_game_play.check_win.called, "check_win should be called"
+        assert not mock_game_play.check_win.called, "turns report the end of the game themselves"
         
         # Verify that the UI methods were called
         mock_game_play.ui.show_player_turn.assert_called_with(mock_player.name)
         mock_game_play.ui.show_game_over.assert_called_once()
+
+    def test_play_standard_skips_eliminated_players(self, mock_game_play):
+        """Test that _play_standard skips eliminated players and stops when none are left."""
+        active, eliminated = MagicMock(eliminated=False), MagicMock(eliminated=True)
+        active.name, eliminated.name = "Active", "Eliminated"
+        mock_game_play.ui = MagicMock()
+        mock_game_play.game_loop.process_ai_turn = MagicMock(return_value=False)
+
+        mock_game_play._play_standard(play_order=[eliminated, active], current_idx=0, max_turns=3)
+        assert mock_game_play.game_loop.process_ai_turn.call_args_list == [call(active)] * 3
+
+        active.eliminated = True
+        mock_game_play.turn_counter = 0
+        mock_game_play._play_standard(play_order=[eliminated, active], current_idx=0, max_turns=3)
+        mock_game_play.ui.show_game_over.assert_called_with("Game over - no active players left")
+
+    def test_play_standard_ends_on_turn_result(self, mock_game_play):
+        """Test that _play_standard ends on a winning turn or when one player is left."""
+        first, second, third = (MagicMock(eliminated=False) for _ in range(3))
+        first.name, second.name, third.name = "First", "Second", "Third"
+        mock_game_play.ui = MagicMock()
+        mock_game_play.winner = "Second"
+        mock_game_play.game_loop.process_ai_turn = MagicMock(side_effect=[False, True])
+
+        mock_game_play._play_standard(play_order=[first, second, third], current_idx=0, max_turns=10)
+        assert mock_game_play.game_loop.process_ai_turn.call_count == 2
+        mock_game_play.ui.show_game_over.assert_called_once_with("Second")
+
+        def lose(player):
+            player.eliminated = True
+            return False
+
+        mock_game_play.turn_counter = 0
+        mock_game_play.game_loop.process_ai_turn = MagicMock(side_effect=lose)
+        mock_game_play._play_standard(play_order=[first, second, third], current_idx=0, max_turns=10)
+        assert mock_game_play.winner == "Third"
+        mock_game_play.ui.show_game_over.assert_called_with("Third")
+
+    def test_play_standard_human_turn_result(self, mock_game_play):
+        """Test that a scripted human accusation ends _play_standard through the real turn."""
+        game = mock_game_play
+        game.ui = MagicMock()
+        game.solution = Solution(SuspectCard("Colonel Mustard"), WeaponCard("Rope"), "Kitchen")
+        human, rival = game.player, MagicMock(eliminated=False)
+        rival.name = "Rival"
+        game.game_loop.process_ai_turn = MagicMock(return_value=False)
+
+        def accuse(suspect, weapon, room):
+            # Make Accusation, pick each card by number, then confirm
+            return ["3", str(game._suspect_names.index(suspect) + 1),
+                    str(game._weapon_names.index(weapon) + 1),
+                    str(game._room_names.index(room) + 1), "y"]
+
+        game.input.side_effect = accuse("Colonel Mustard", "Rope", "Kitchen")
+        game._play_standard(play_order=[human, rival], current_idx=0, max_turns=10)
+        assert game.winner == human.name
+        assert not game.game_loop.process_ai_turn.called
+        game.ui.show_game_over.assert_called_once_with(human.name)
+
+        game.turn_counter, game.winner = 0, None
+        game.input.side_effect = accuse("Mrs. White", "Rope", "Kitchen")
+        game._play_standard(play_order=[human, rival], current_idx=0, max_turns=10)
+        assert human.eliminated
+        assert game.winner == "Rival"
+        game.ui.show_game_over.assert_called_with("Rival")
+
+    def test_game_loop_drops_eliminated_players(self):
+        """Test that GameLoop.play stops giving turns to a player once eliminated."""
+        game = MagicMock()
+        game.win_condition_checker.check_win_condition.return_value = None
+        game.win_condition_checker.check_game_over.return_value = False
+        first, second = Player(SuspectCard("Miss Scarlett")), Player(SuspectCard("Colonel Mustard"))
+        loop = GameLoop(game)
+        loop._get_play_order = MagicMock(return_value=[first, second])
+        turns = []
+
+        def take_turn(player):
+            turns.append(player)
+            player.eliminated = player is first
+            return False
+
+        loop._handle_player_turn = MagicMock(side_effect=take_turn)
+        assert loop.play(max_turns=4) is False
+        assert turns == [first, second, second, second]
+
+    def test_roll_dice_batches(self):
+        """Test that dice come from batches drawn from the game's current generator."""
+        game = MagicMock()
+        game.rng = np.random.default_rng(3)
+        loop = GameLoop(game)
+        rolls = [loop._roll_dice() for _ in range(300)]
+        assert all(type(roll) is int and 2 <= roll <= 12 for roll in rolls)
+
+        game.rng = np.random.default_rng(3)
+        assert loop._roll_dice() == rolls[0]
+
+    def test_active_players_rotation(self):
+        """Test that active players start from the given seat and skip eliminated ones."""
+        players = [Player(SuspectCard(name)) for name in ("Miss Scarlett", "Colonel Mustard", "Mrs. White")]
+        players[0].eliminated = True
+        loop = GameLoop(MagicMock())
+        assert list(loop._active_players(players, 1)) == players[1:]
+        assert list(loop._active_players(players, 2)) == [players[2], players[1]]
+
+    def test_self_play_setup(self):
+        """Test that self-play seats each AI once and deals every non-solution card."""
+        game = _setup_game(0)
+        seated = game.game_loop._get_play_order()
+        assert len(seated) == len({id(player) for player in seated}) == 4
+        assert sum(len(player.hand) for player in seated) == 18
+        assert all(player.model.seen_cards >= {card.name for card in player.hand} for player in seated)
+
+    def test_self_play_games(self):
+        """Test that AI-only games run headless to a correct accusation, in seed order."""
+        seed, finished, winner, turns = run_one_game(0, max_turns=300)
+        assert seed == 0
+        assert finished is True
+        assert winner is not None and 0 < turns < 300
+
+        # The AIs' suggestions were refuted and recorded along the way
+        game = _setup_game(0)
+        game.game_loop.play(10)
+        assert any(entry['refuting_player'] for entry in game.suggestion_history.get_all())
+
+        results = run_games([3, 1], max_turns=10, max_workers=2)
+        assert [result[0] for result in results] == [3, 1]
+        assert all(result[3] <= 10 for result in results)
@@ -7,17 +7,18 @@ This file consolidates tests for:
 
 Aims to achieve 90%+ code coverage.
 """
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch, call
 
 from cluedo_game.accusation import make_accusation
-from cluedo_game.solution import Solution
+from cluedo_game.solution import Solution, solution_key
 from cluedo_game.suggestion import Suggestion
 from cluedo_game.cards import SuspectCard, WeaponCard, RoomCard
 from cluedo_game.player import Player
 from cluedo_game.character import Character, get_characters
 from cluedo_game.weapon import Weapon, get_weapons
-from cluedo_game.mansion import Mansion
+from cluedo_game.mansion import Mansion, Room
 
 
 # -----------------------------------------------------------------------------
@@ -77,6 +78,13 @@ class TestAccusation:
         ])
         assert mock_player.eliminated is False  # Player should not be eliminated
     
+    def test_correct_accusation_with_room_object(self, mock_game, mock_player, mock_suspect, mock_weapon):
+        """Test that an accusation naming the solution room by Room object wins."""
+        mock_game.solution = Solution(mock_suspect, mock_weapon, RoomCard("Library"))
+        
+        assert make_accusation(mock_game, mock_player, mock_suspect, mock_weapon, Room("Library")) is True
+        assert mock_player.eliminated is False
+    
     def test_incorrect_accusation_wrong_suspect(self, mock_game, mock_player, mock_suspect, mock_weapon, mock_room):
         """Test that an accusation with the wrong suspect results in elimination."""
         # Create a different suspect for the solution
@@ -206,6 +214,17 @@ class TestSolution:
         assert solution.weapon == mock_weapon
         assert solution.room == mock_room
     
+    def test_solution_key(self):
+        """Test the solution key holds the names of all three solution cards."""
+        solution = Solution(SuspectCard("Mrs. White"), WeaponCard("Rope"), RoomCard("Hall"))
+        assert solution.key == ("Mrs. White", "Rope", "Hall")
+        assert solution_key(solution) is solution.key
+        
+        # Solution-like objects have their names read directly
+        other = MagicMock()
+        other.character.name, other.weapon.name, other.room = "Mrs. White", "Rope", "Hall"
+        assert solution_key(other) == solution.key
+    
     def test_repr_representation(self, solution, mock_suspect, mock_weapon, mock_room):
         """Test the string representation of a Solution instance."""
         expected_string = f"Solution: {mock_suspect.name} with the {mock_weapon.name} in the {mock_room.name}"
@@ -245,6 +264,15 @@ class TestSolution:
                         # Verify calls to random.choice
                         assert mock_random.choice.call_count == 3
     
+    def test_random_solution_with_generator(self):
+        """Test that random_solution draws from a given numpy Generator reproducibly."""
+        first = Solution.random_solution(np.random.default_rng(42))
+        second = Solution.random_solution(np.random.default_rng(42))
+        assert first.key == second.key
+        assert all(type(name) is str for name in first.key)
+        assert first.character.name in [c.name for c in get_characters()]
+        assert first.weapon.name in [w.name for w in get_weapons()]
+    
     def test_matches(self, solution, mock_suspect, mock_weapon, mock_room):
         """Test checking if a solution matches specific cards."""
         # Test with the same cards
@@ -53,6 +53,17 @@ class TestSuggestionHistory:
         assert records[0]["suggesting_player"] == "Miss Scarlett"
         assert records[1]["suggesting_player"] == "Professor Plum"
 
+    def test_len_and_truthiness(self):
+        """Test that a history's length and truthiness follow its records."""
+        history = SuggestionHistory()
+        assert len(history) == 0
+        assert not history
+        
+        history.add("Miss Scarlett", SuspectCard("Colonel Mustard"), WeaponCard("Rope"), 
+                   RoomCard("Kitchen"), None, None)
+        assert len(history) == 1
+        assert history
+
     def test_str_empty_history(self):
         """Test string representation of an empty history."""
         history = SuggestionHistory()
@@ -12,6 +12,7 @@ Aims to achieve comprehensive test coverage of NashAIPlayer."""
 import pytest
 import logging
 import math
+import numpy as np
 from unittest.mock import MagicMock, patch, call
 
 from cluedo_game.game import CluedoGame
@@ -20,7 +21,8 @@ from cluedo_game.solution import Solution
 from cluedo_game.history import SuggestionHistory
 from cluedo_game.cards import SuspectCard, WeaponCard, RoomCard, get_suspects, get_weapons, get_rooms
 from cluedo_game.player import Player
-from cluedo_game.ai import NashAIPlayer
+from cluedo_game.ai import nash_ai_player as nash_ai_module
+from cluedo_game.ai import NashAIPlayer, BayesianModel, MovementStrategy, SuggestionEngine, SuggestionRecord
 from cluedo_game.character import Character
 from cluedo_game.weapon import Weapon
 
@@ -77,7 +79,7 @@ def all_cards():
     suspects = get_suspects()
     weapons = get_weapons()
     rooms = [RoomCard(room) for room in get_rooms()]
-    return suspects + weapons + rooms
+    return [*suspects, *weapons, *rooms]
 
 @pytest.fixture
 def nash_ai(mock_game):
@@ -392,6 +394,326 @@ class TestNashAICoverage:
             assert 'character' in suggestion
             assert 'weapon' in suggestion
             assert 'room' in suggestion
+    
+    def test_in_corridor_follows_position(self, nash_ai):
+        """Test the corridor flag is updated on every position assignment."""
+        nash_ai.position = "C1"
+        assert nash_ai._in_corridor
+        nash_ai.position = "Conservatory"
+        assert not nash_ai._in_corridor
+        nash_ai.position = Room("Kitchen")
+        assert not nash_ai._in_corridor
+        nash_ai.position = None
+        assert not nash_ai._in_corridor
+    
+    def test_name_follows_character(self, nash_ai):
+        """Test the cached display name is rebuilt when the character changes."""
+        nash_ai.name = "Mrs. White"
+        assert nash_ai.name == "Mrs. White (AI)"
+        nash_ai.character = SuspectCard("Colonel Mustard")
+        assert nash_ai.name == "Colonel Mustard (AI)"
+    
+    def test_game_api_resolved_per_game(self, nash_ai, mock_game):
+        """Test the game hooks are looked up once and re-resolved for a new game."""
+        nash_ai._log_suggestion(mock_game, nash_ai.make_suggestion(), None, None)
+        assert nash_ai._api_game is mock_game
+        assert nash_ai._api_output is mock_game.output
+        
+        other_game = MagicMock(spec=['output'])
+        nash_ai._log_suggestion(other_game, nash_ai.make_suggestion(), None, None)
+        assert nash_ai._api_output is other_game.output
+        assert nash_ai._api_history_add is None
+        other_game.output.assert_called_once()
+        
+        # Quiet games get no narration
+        quiet_game = MagicMock(spec=['output', 'verbose'], verbose=False)
+        nash_ai._log_suggestion(quiet_game, nash_ai.make_suggestion(), None, None)
+        assert nash_ai._api_output is None
+        quiet_game.output.assert_not_called()
+        
+        silent_game = MagicMock(spec=['output'], output=nash_ai_module._noop)
+        nash_ai._log_suggestion(silent_game, nash_ai.make_suggestion(), None, None)
+        assert nash_ai._api_output is None
+
+# -----------------------------------------------------------------------------
+# Bayesian Model Tests
+# -----------------------------------------------------------------------------
+class TestBayesianModel:
+    """Test suite for the array-backed BayesianModel."""
+    
+    def test_card_reveal_renormalizes_posteriors(self):
+        """Revealing a card zeroes it and renormalizes the rest of its type."""
+        model = BayesianModel()
+        model.update_from_card_reveal(SuspectCard("Miss Scarlett"), "Mrs. White")
+        
+        assert model.get_card_probability('suspects', "Miss Scarlett") == 0.0
+        assert model.get_card_probability('suspects', "Mrs. Peacock") == pytest.approx(0.2)
+        assert sum(model.posteriors['suspects'].values()) == pytest.approx(1.0)
+        # Other card types are untouched
+        assert model.get_card_probability('rooms', "Kitchen") == pytest.approx(1.0 / 9)
+    
+    def test_batch_defers_posterior_update(self):
+        """Evidence recorded inside a batch is applied once at end_batch()."""
+        model = BayesianModel()
+        model.begin_batch()
+        model.update_from_card_reveal(WeaponCard("Rope"), "Mrs. White")
+        model.update_from_card_reveal(WeaponCard("Dagger"), "Mrs. White")
+        
+        assert model.get_card_probability('weapons', "Rope") == pytest.approx(1.0 / 6)
+        
+        model.end_batch()
+        assert model.get_card_probability('weapons', "Rope") == 0.0
+        assert model.get_card_probability('weapons', "Wrench") == pytest.approx(0.25)
+    
+    def test_get_room_probs(self):
+        """Room probabilities are returned in order, with 0.0 for non-rooms."""
+        model = BayesianModel()
+        model.update_from_card_reveal(RoomCard("Hall"), "Mrs. White")
+        
+        probs = model.get_room_probs(["Kitchen", "Hall", "C7"])
+        assert probs.tolist() == pytest.approx([0.125, 0.0, 0.0])
+    
+    def test_posteriors_view_writes_through(self):
+        """Writes through the posteriors dict view update the model."""
+        model = BayesianModel()
+        model.posteriors['weapons']['Rope'] = 0.0
+        
+        assert model.get_card_probability('weapons', 'Rope') == 0.0
+        assert model.get_card_probability('weapons', 'Not A Weapon') == 0.0
+        
+        view = model.posteriors['suspects']
+        view.update(dict.fromkeys(["Miss Scarlett", "Colonel Mustard"], 0.0))
+        assert model.posteriors['suspects'] is view
+        assert model.get_card_probability('suspects', "Colonel Mustard") == 0.0
+        assert model.get_card_probability('suspects', "Mrs. White") == pytest.approx(0.25)
+
+    def test_reveal_after_cleared_posteriors_rebuilds_from_priors(self):
+        """A reveal on fully cleared posteriors recomputes them from the priors."""
+        model = BayesianModel()
+        for name in list(model.posteriors['rooms']):
+            model.posteriors['rooms'][name] = 0.0
+
+        model.update_from_card_reveal(RoomCard("Hall"), "Mrs. White")
+        assert model.get_card_probability('rooms', "Hall") == 0.0
+        assert model.get_card_probability('rooms', "Kitchen") == pytest.approx(0.125)
+
+    def test_no_refutation_raises_posterior(self):
+        """Cards nobody could refute become more likely to be in the solution."""
+        model = BayesianModel()
+        game = MagicMock()
+        game.players = [MagicMock(), MagicMock()]
+        game.players[0].name = "Mrs. White"
+        game.players[1].name = "Colonel Mustard"
+        suggestion = {
+            'character': SuspectCard("Miss Scarlett"),
+            'weapon': WeaponCard("Rope"),
+            'room': "Kitchen"
+        }
+
+        model.update_from_no_refutation(suggestion, game)
+
+        assert model.player_not_cards["Mrs. White"] == {"Miss Scarlett", "Rope", "Kitchen"}
+        assert model.get_card_probability('weapons', "Rope") > model.get_card_probability('weapons', "Wrench")
+        assert model.get_most_likely_solution() == {
+            'character': "Miss Scarlett", 'weapon': "Rope", 'room': "Kitchen"
+        }
+        assert sum(model.posteriors['rooms'].values()) == pytest.approx(1.0)
+
+    def test_most_likely_solution_follows_model_version(self):
+        """The most likely solution is cached until the belief state changes."""
+        model = BayesianModel()
+        weapon = model.get_most_likely_solution()['weapon']
+
+        # Callers get their own copy of the cached result
+        model.get_most_likely_solution()['weapon'] = "Nothing"
+        assert model.get_most_likely_solution()['weapon'] == weapon
+
+        model.update_from_card_reveal(WeaponCard(weapon), "Mrs. White")
+        assert model.get_most_likely_solution()['weapon'] != weapon
+
+    def test_get_seen_flags(self):
+        """Seen flags follow card reveals and are False for unknown names."""
+        model = BayesianModel()
+        model.update_from_card_reveal(WeaponCard("Rope"), "Mrs. White")
+        flags = model.get_seen_flags('weapons', ["Rope", "Dagger", "Nothing"])
+        assert flags.tolist() == [True, False, False]
+
+    def test_player_card_matrices(self):
+        """Card reveals fill the holds matrix behind the player_cards view."""
+        model = BayesianModel()
+        for i in range(8):
+            model.update_from_card_reveal(WeaponCard("Rope"), f"Player {i}")
+        model.update_from_card_reveal(RoomCard("Hall"), "Player 0")
+
+        assert model.player_cards["Player 0"] == {"Rope", "Hall"}
+        assert model.player_cards["Nobody"] == set()
+        assert "Nobody" not in model.player_cards
+        assert model.holds.shape[0] >= 8
+        assert int(model.holds.sum()) == 9
+
+    def test_posterior_kernels_agree(self):
+        """The loop kernel and the NumPy fallback compute the same posterior."""
+        from cluedo_game.ai._kernels import _update_posterior_loop, _update_posterior_numpy
+
+        prior = np.full(4, 0.25)
+        seen = np.array([False, True, False, False])
+        not_holding = np.array([0, 1, 2, 0], dtype=np.uint64)
+        loop_out, numpy_out = np.empty(4), np.empty(4)
+        assert _update_posterior_loop(prior, seen, not_holding, 0.5, loop_out) == pytest.approx(
+            _update_posterior_numpy(prior, seen, not_holding, 0.5, numpy_out)
+        )
+        assert loop_out.tolist() == pytest.approx(numpy_out.tolist())
+        assert loop_out[1] == 0.0
+
+    def test_belief_update_skips_unchanged_evidence(self):
+        """The learning module only re-reads a game when its evidence has changed."""
+        from cluedo_game.ai.learning import LearningModule
+
+        model = MagicMock()
+        learning = LearningModule(model)
+        player = Player(SuspectCard("Miss Scarlett"))
+        player.hand = [WeaponCard("Rope")]
+        game = MagicMock()
+        game.get_all_players.return_value = [player]
+        game.suggestion_history = SuggestionHistory()
+
+        learning.update_belief_state(game)
+        learning.update_belief_state(game)
+        assert model.begin_batch.call_count == 1
+
+        player.hand.append(WeaponCard("Dagger"))
+        learning.update_belief_state(game)
+        assert model.begin_batch.call_count == 2
+
+        learning.reset_game_state()
+        learning.update_belief_state(game)
+        assert model.begin_batch.call_count == 3
+
+class TestMovementStrategy:
+    """Test suite for the MovementStrategy component."""
+    
+    def test_record_room_visit_keeps_last_three(self):
+        """Only the three most recently visited rooms are remembered."""
+        strategy = MovementStrategy(BayesianModel())
+        for room in ["Kitchen", "Hall", "Study", "Kitchen", "Library", "Lounge"]:
+            strategy.record_room_visit(room)
+        
+        assert strategy.visited_rooms == {"Kitchen", "Library", "Lounge"}
+
+    def test_choose_destination_heads_for_near_certain_room(self):
+        """A room that is almost certainly the answer is chosen outright."""
+        model = BayesianModel()
+        for room in ["Hall", "Lounge", "Dining Room", "Ballroom", "Conservatory",
+                     "Billiard Room", "Library", "Study"]:
+            model.update_from_card_reveal(RoomCard(room), "Mrs. White")
+        strategy = MovementStrategy(model)
+        strategy.record_room_visit("Kitchen")
+
+        assert strategy.choose_destination("C7", ["C6", "Hall", "Kitchen"], MagicMock()) == "Kitchen"
+
+    def test_adjacency_lookup_follows_game_state(self):
+        """Adjacency is resolved once per game state and re-resolved for a new one."""
+        strategy = MovementStrategy(BayesianModel())
+        mansion = Mansion()
+
+        game = MagicMock()
+        game.mansion = mansion
+        assert strategy._get_adjacent_rooms("C1", game) == tuple(mansion.get_adjacent_rooms("C1"))
+
+        board_game = MagicMock(spec=['board'])
+        board_game.board.get_adjacent_rooms.return_value = ["Study"]
+        assert strategy._get_adjacent_rooms("Hall", board_game) == ["Study"]
+
+        from cluedo_game.ai.movement_strategy import _adjacent_rooms_cached
+
+        # Building another strategy keeps the shared memo; a new game clears it
+        MovementStrategy(BayesianModel())
+        assert _adjacent_rooms_cached.cache_info().currsize > 0
+        strategy.reset_game_state()
+        assert _adjacent_rooms_cached.cache_info().currsize == 0
+        assert list(strategy._get_adjacent_rooms("Hall", object())) == []
+
+    def test_score_kernels_agree(self):
+        """The loop kernel and the NumPy fallback produce the same scores."""
+        from cluedo_game.ai._kernels import _score_destinations_loop, _score_destinations_numpy
+
+        args = (
+            np.array([0.0, 0.25, 0.5, 0.0]),
+            np.array([False, True, False, False]),
+            np.array([True, False, False, True]),
+            np.array([True, False, False, False]),
+            np.array([0.1, 0.2, 0.3]),
+            np.array([0, 2, 2, 3, 3]),
+        )
+        assert _score_destinations_loop(*args).tolist() == pytest.approx(
+            _score_destinations_numpy(*args).tolist()
+        )
+
+class TestSuggestionEngine:
+    """Test suite for the SuggestionEngine component."""
+    
+    def test_make_suggestion_matches_pairwise_scores(self):
+        """The vectorized search picks the best pair under the per-pair scores."""
+        model = BayesianModel()
+        for card in [SuspectCard("Miss Scarlett"), WeaponCard("Rope"), WeaponCard("Dagger"), RoomCard("Hall")]:
+            model.update_from_card_reveal(card, "Mrs. White")
+        engine = SuggestionEngine(model)
+        
+        confidence = engine._calculate_solution_confidence()
+        best_score, expected = float('-inf'), None
+        for suspect in get_suspects():
+            for weapon in get_weapons():
+                if suspect.name in model.seen_cards and weapon.name in model.seen_cards:
+                    continue
+                score = (confidence * engine._calculate_probability_score(suspect, weapon, "Kitchen") +
+                         (1.0 - confidence) * engine._calculate_information_value(suspect, weapon, "Kitchen"))
+                score += 0.2 * (suspect.name not in model.seen_cards) + 0.2 * (weapon.name not in model.seen_cards)
+                if score > best_score:
+                    best_score, expected = score, (suspect.name, weapon.name)
+        
+        suggestion = engine.make_suggestion("Kitchen", MagicMock())
+        assert (suggestion['character'].name, suggestion['weapon'].name) == expected
+        assert suggestion['room'] == "Kitchen"
+
+    def test_solution_confidence_follows_model_version(self):
+        """Confidence is cached until the belief state changes."""
+        model = BayesianModel()
+        engine = SuggestionEngine(model)
+        confidence = engine._calculate_solution_confidence()
+
+        with patch.object(BayesianModel, 'get_most_likely_solution') as most_likely:
+            assert engine._calculate_solution_confidence() == confidence
+            most_likely.assert_not_called()
+
+        version = model.version
+        model.update_from_card_reveal(WeaponCard("Rope"), "Mrs. White")
+        assert model.version > version
+        assert engine._calculate_solution_confidence() > confidence
+
+    def test_make_suggestion_fallback_is_deterministic(self):
+        """With every card seen, the fallback picks the first least likely cards."""
+        model = BayesianModel()
+        for card in get_suspects() + get_weapons():
+            model.update_from_card_reveal(card, "Mrs. White")
+        engine = SuggestionEngine(model)
+
+        suggestion = engine.make_suggestion("Kitchen", MagicMock())
+        assert suggestion['character'].name == get_suspects()[0].name
+        assert suggestion['weapon'].name == get_weapons()[0].name
+        assert suggestion == engine.make_suggestion("Kitchen", MagicMock())
+
+    def test_record_suggestion(self):
+        """Suggestions are kept in the history as SuggestionRecord entries."""
+        engine = SuggestionEngine(BayesianModel())
+        suggestion = engine.make_suggestion("Kitchen", MagicMock())
+        engine.record_suggestion("Mrs. White", suggestion, "Colonel Mustard")
+
+        record = engine.suggestion_history[0]
+        assert isinstance(record, SuggestionRecord)
+        assert record.player == "Mrs. White"
+        assert record.suggestion is suggestion
+        assert record.refuting_player == "Colonel Mustard"
+        assert record.shown_card is None
 
 # -----------------------------------------------------------------------------
 # Nash AI Integration Tests
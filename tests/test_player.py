@@ -5,7 +5,7 @@ Aims to achieve 90%+ code coverage.
 import pytest
 from unittest.mock import MagicMock
 
-from cluedo_game.player import Player
+from cluedo_game.player import Player, PlayerRoster
 from cluedo_game.cards import SuspectCard
 
 
@@ -75,3 +75,25 @@ class TestPlayer:
         assert repr(player) == expected
         
 
+    
+    def test_roster_mirrors_players(self):
+        """Test that a roster tracks its players' positions and eliminations."""
+        first, second = Player(SuspectCard("Miss Scarlett")), Player(SuspectCard("Colonel Mustard"))
+        first.position = "C1"
+        roster = PlayerRoster([first, second])
+        
+        assert roster.index == {first: 0, second: 1}
+        assert list(roster.positions) == ["C1", None]
+        assert roster.active_players() == [first, second]
+        
+        second.position = "Hall"
+        second.eliminated = True
+        assert roster.positions[1] == "Hall"
+        assert list(roster.active_seats()) == [0]
+        assert roster.active_players() == [first]
+    
+    def test_slots(self, player):
+        """Test that players keep their attributes in slots rather than a dict."""
+        assert not hasattr(player, '__dict__')
+        with pytest.raises(AttributeError):
+            player.nickname = "Mustard"